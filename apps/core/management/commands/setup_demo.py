@@ -82,15 +82,16 @@ class Command(BaseCommand):
             self.stdout.write(self.style.SUCCESS(f"Created floor: {floor.name}"))
 
             # Create 3 demo tables
-            for i in range(1, 4):
-                table = Table(
-                    floor=floor,
-                    number=f"T{i}",
-                    name=f"Table {i}",
-                    capacity=4,
-                    table_type=Table.TableType.FOUR_SEATER,
-                )
-                table.save()
+            tables = Table.bulk_create_for_floor(floor, [
+                {
+                    "number": f"T{i}",
+                    "name": f"Table {i}",
+                    "capacity": 4,
+                    "table_type": Table.TableType.FOUR_SEATER,
+                }
+                for i in range(1, 4)
+            ])
+            for table in tables:
                 self.stdout.write(self.style.SUCCESS(f"Created table: {table.number}"))
         else:
             self.stdout.write(self.style.WARNING("Outlet already exists"))
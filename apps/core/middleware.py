@@ -72,7 +72,8 @@ class NoCacheMiddleware:
 
         # Add no-cache headers for authenticated users
         # This prevents the browser from caching pages that require login
-        if request.user.is_authenticated:
+        # (views that set their own Cache-Control are left alone)
+        if request.user.is_authenticated and not response.has_header("Cache-Control"):
             response["Cache-Control"] = "no-cache, no-store, must-revalidate, private"
             response["Pragma"] = "no-cache"
             response["Expires"] = "0"
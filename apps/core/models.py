@@ -2,6 +2,7 @@
 Core models and utilities for the Coffee Shop Management System.
 """
 
+from django.core.cache import cache
 from django.db import models
 
 
@@ -151,6 +152,22 @@ class BusinessSettings(SingletonModel):
     def __str__(self):
         return self.business_name
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # Clear cache
+        cache.delete("business_settings")
+
+    @classmethod
+    def load(cls):
+        """Load the singleton instance, cached across requests."""
+        cached = cache.get("business_settings")
+        if cached:
+            return cached
+
+        obj = super().load()
+        cache.set("business_settings", obj, 30)  # Cache for 30 seconds
+        return obj
+
 
 class TaxSettings(SingletonModel):
     """
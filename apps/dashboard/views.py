@@ -6,7 +6,7 @@ from django.contrib import messages
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.decorators import login_required
 from django.db import models
-from django.db.models import Count, Sum, Q
+from django.db.models import Count, ExpressionWrapper, Sum, Q
 from django.http import HttpResponseRedirect
 from django.shortcuts import redirect, render
 from django.urls import reverse
@@ -764,8 +764,19 @@ def table_list(request):
         to_attr="active_combined_orders"
     )
 
+    # The QR PNG bytes stay in the database; the list only needs to know
+    # whether one has been stored yet
     floors = Floor.objects.filter(is_active=True).prefetch_related(
-        Prefetch("tables", queryset=Table.objects.prefetch_related(active_order_prefetch, combined_order_prefetch))
+        Prefetch(
+            "tables",
+            queryset=Table.objects.defer("qr_image")
+            .annotate(
+                has_qr_image=ExpressionWrapper(
+                    Q(qr_image__isnull=False), output_field=models.BooleanField()
+                )
+            )
+            .prefetch_related(active_order_prefetch, combined_order_prefetch),
+        )
     ).order_by("display_order")
 
     # Filter by outlet
@@ -881,7 +892,7 @@ def table_take_order(request, pk):
                 combined = Table.objects.filter(pk__in=combine_tables).exclude(pk=table.pk)
                 order.combined_tables.set(combined)
                 # Mark combined tables as occupied
-                combined.update(status=Table.Status.OCCUPIED)
+                Table.bulk_set_status(combined, Table.Status.OCCUPIED)
 
             # Create kitchen ticket
             KitchenOrderTicket.objects.create(order=order)
@@ -906,7 +917,7 @@ def table_take_order(request, pk):
         available_tables = Table.objects.filter(
             floor=table.floor,
             status=Table.Status.VACANT
-        ).exclude(pk=table.pk).order_by("number")
+        ).exclude(pk=table.pk).defer("qr_image").order_by("number")
 
         context = {
             "page_title": f"Table {table.number} - Select Order",
@@ -920,7 +931,7 @@ def table_take_order(request, pk):
     available_tables = Table.objects.filter(
         floor=table.floor,
         status=Table.Status.VACANT
-    ).exclude(pk=table.pk).order_by("number")
+    ).exclude(pk=table.pk).defer("qr_image").order_by("number")
 
     if available_tables.exists():
         # Show option to combine tables
@@ -1474,10 +1485,9 @@ def table_create(request):
                         table_type=table_type,
                     )
                     # Generate QR code
-                    from apps.tables.utils import generate_table_qr_code
+                    from apps.tables.utils import store_table_qr_code
                     try:
-                        qr_file = generate_table_qr_code(table)
-                        table.qr_code.save(qr_file.name, qr_file, save=True)
+                        store_table_qr_code(table)
                     except Exception as e:
                         # Log error but don't fail table creation
                         pass
@@ -1562,12 +1572,6 @@ def table_delete(request, pk):
             messages.error(request, f"Cannot delete table '{table.number}' - it has an active session.")
         else:
             number = table.number
-            # Delete QR code file if exists
-            if table.qr_code:
-                try:
-                    table.qr_code.delete(save=False)
-                except Exception:
-                    pass
             table.delete()
             messages.success(request, f"Table '{number}' deleted successfully.")
     except Table.DoesNotExist:
@@ -2,10 +2,34 @@
 Kitchen Display System services for real-time order management.
 """
 
+import threading
+import weakref
+
+import orjson
 from asgiref.sync import async_to_sync
 from channels.layers import get_channel_layer
+from django.core.cache import cache
+from django.db import transaction
 from django.utils import timezone
 
+# Serialized kitchen orders list shared by every display that asks for it;
+# kept short-lived since elapsed times and untracked edits go stale
+KITCHEN_PAYLOAD_CACHE_KEY = "kitchen:payload"
+KITCHEN_PAYLOAD_CACHE_TIMEOUT = 2
+
+# Kitchen event flushes waiting on a commit in this thread, one per atomic
+# block (keyed by its savepoint stack). Held weakly: Django's on_commit list
+# owns each flush, so rolling a block back drops its events along with it.
+_pending_flushes = threading.local()
+
+
+def encode_event(data):
+    """
+    Encode a WebSocket event once on the producer side; consumers send the
+    text as-is instead of re-encoding it for every socket in the group.
+    """
+    return orjson.dumps(data, default=str).decode()
+
 
 def get_order_data(order):
     """
@@ -60,10 +84,6 @@ def broadcast_to_kitchen(event_type, order, extra_data=None):
     """
     Broadcast an event to the kitchen display WebSocket group.
     """
-    channel_layer = get_channel_layer()
-    if not channel_layer:
-        return
-
     data = {
         "type": event_type,
         "order": get_order_data(order),
@@ -73,13 +93,9 @@ def broadcast_to_kitchen(event_type, order, extra_data=None):
     if extra_data:
         data.update(extra_data)
 
-    async_to_sync(channel_layer.group_send)(
-        "cafe_kitchen",
-        {
-            "type": "send_event",
-            "data": data,
-        }
-    )
+    # Only the latest update of an order is worth sending
+    key = (event_type, order.pk) if event_type == "order_updated" else None
+    queue_kitchen_events([(key, encode_event(data))])
 
 
 def broadcast_new_order(order):
@@ -90,6 +106,93 @@ def broadcast_new_order(order):
     broadcast_to_kitchen("new_order", order)
 
 
+def broadcast_new_orders(orders):
+    """
+    Broadcast a batch of new orders to the kitchen display in one
+    channel layer send. Used by the offline sync endpoint.
+    """
+    if not orders:
+        return
+
+    timestamp = timezone.now().isoformat()
+    queue_kitchen_events([
+        (None, encode_event({
+            "type": "new_order",
+            "order": get_order_data(order),
+            "timestamp": timestamp,
+        }))
+        for order in orders
+    ])
+
+
+class _KitchenFlush:
+    """
+    Kitchen events buffered by one atomic block, sent together once the
+    transaction commits.
+    """
+
+    def __init__(self):
+        self.events = []
+        self.sent = False
+
+    def add(self, key, encoded):
+        if key is not None:
+            self.events = [event for event in self.events if event[0] != key]
+        self.events.append((key, encoded))
+
+    def __call__(self):
+        self.sent = True
+        send_kitchen_events([encoded for _, encoded in self.events])
+
+
+def queue_kitchen_events(events):
+    """
+    Queue ``(key, encoded)`` kitchen events until the current transaction
+    commits (sent straight away outside one). Everything queued inside one
+    atomic block goes out in a single send; a later event with the same
+    non-empty key replaces the earlier one. Events from a rolled-back
+    transaction or savepoint never reach the displays.
+    """
+    connection = transaction.get_connection()
+    if not connection.in_atomic_block:
+        send_kitchen_events([encoded for _, encoded in events])
+        return
+
+    flushes = getattr(_pending_flushes, "by_block", None)
+    if flushes is None:
+        flushes = _pending_flushes.by_block = weakref.WeakValueDictionary()
+
+    block = tuple(connection.savepoint_ids)
+    flush = flushes.get(block)
+    if flush is None or flush.sent:
+        flush = flushes[block] = _KitchenFlush()
+        transaction.on_commit(flush)
+
+    for key, encoded in events:
+        flush.add(key, encoded)
+
+
+def send_kitchen_events(encoded_events):
+    """
+    Send encoded kitchen events to the kitchen group in one channel layer
+    send; consumers forward them in order. The cached orders list is dropped
+    first so displays refreshing on the event rebuild from committed rows.
+    """
+    invalidate_kitchen_payload()
+
+    channel_layer = get_channel_layer()
+    if not channel_layer:
+        return
+
+    async_to_sync(channel_layer.group_send)(
+        "cafe_kitchen",
+        {
+            "type": "send_events",
+            "encoded": encoded_events,
+        }
+    )
+
+
 def broadcast_order_updated(order):
     """
     Broadcast order update to the kitchen display.
@@ -137,7 +240,7 @@ def notify_waiter_order_ready(order):
     Send notification to waiter when their order is ready for pickup.
     """
     # Only notify if order has a creator (the waiter who placed it)
-    if not order.created_by:
+    if not order.created_by_id:
         return
 
     channel_layer = get_channel_layer()
@@ -151,13 +254,16 @@ def notify_waiter_order_ready(order):
 
     # Send to waiter's personal channel
     async_to_sync(channel_layer.group_send)(
-        f"waiter_{order.created_by.id}",
+        f"waiter_{order.created_by_id}",
         {
-            "type": "order_ready",
-            "order_id": order.id,
-            "order_number": order.order_number,
-            "table": table_info,
-            "message": f"Order #{order.order_number} for {table_info} is ready!",
+            "type": "send_event",
+            "encoded": encode_event({
+                "type": "order_ready",
+                "order_id": order.id,
+                "order_number": order.order_number,
+                "table": table_info,
+                "message": f"Order #{order.order_number} for {table_info} is ready!",
+            }),
         }
     )
 
@@ -182,6 +288,32 @@ def get_kitchen_orders():
     }
 
 
+def build_kitchen_payload():
+    """
+    Serialize all active kitchen orders, keyed by status, in one pass.
+    get_kitchen_orders() joins and prefetches everything get_order_data reads.
+    """
+    return {
+        status: [get_order_data(order) for order in queryset]
+        for status, queryset in get_kitchen_orders().items()
+    }
+
+
+def get_cached_kitchen_payload():
+    """
+    Kitchen orders list, rebuilt at most once per cache window so displays
+    reconnecting together don't each rerun the queries.
+    """
+    return cache.get_or_set(
+        KITCHEN_PAYLOAD_CACHE_KEY, build_kitchen_payload, KITCHEN_PAYLOAD_CACHE_TIMEOUT
+    )
+
+
+def invalidate_kitchen_payload():
+    """Drop the cached kitchen orders list after a kitchen-visible change."""
+    cache.delete(KITCHEN_PAYLOAD_CACHE_KEY)
+
+
 def bump_order(order, user=None):
     """
     Bump an order from preparing to ready status.
@@ -271,9 +403,13 @@ def set_order_priority(order, priority, user=None):
     ticket = order.kitchen_ticket
     old_priority = ticket.priority
 
-    if priority not in [choice[0] for choice in KitchenOrderTicket.Priority.choices]:
+    if priority not in KitchenOrderTicket.Priority.values:
         return False, "Invalid priority value"
 
+    # Nothing to write or broadcast when the priority is unchanged
+    if priority == old_priority:
+        return True, f"Priority changed to {priority}"
+
     ticket.priority = priority
     ticket.save(update_fields=["priority"])
 
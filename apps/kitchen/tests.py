@@ -1,3 +1,94 @@
-from django.test import TestCase
+from types import SimpleNamespace
+from unittest import mock
 
-# Create your tests here.
+import orjson
+from django.db import transaction
+from django.test import TransactionTestCase
+
+from apps.kitchen import services
+
+
+class KitchenBroadcastTests(TransactionTestCase):
+    def setUp(self):
+        self.layer = mock.Mock()
+        self.layer.group_send = mock.AsyncMock()
+        patches = [
+            mock.patch.object(services, "get_channel_layer", return_value=self.layer),
+            mock.patch.object(
+                services, "get_order_data",
+                side_effect=lambda order: {"id": order.pk, "status": order.status},
+            ),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def sent_events(self, call):
+        group, message = call.args
+        self.assertEqual(group, "cafe_kitchen")
+        self.assertEqual(message["type"], "send_events")
+        return [orjson.loads(encoded) for encoded in message["encoded"]]
+
+    def test_sends_immediately_outside_transaction(self):
+        services.broadcast_new_order(SimpleNamespace(pk=1, status="confirmed"))
+
+        self.layer.group_send.assert_called_once()
+
+    def test_coalesces_events_until_commit(self):
+        first = SimpleNamespace(pk=1, status="confirmed")
+        second = SimpleNamespace(pk=2, status="confirmed")
+
+        with transaction.atomic():
+            services.broadcast_new_order(first)
+            services.broadcast_new_order(second)
+            services.broadcast_order_bumped(first)
+            self.layer.group_send.assert_not_called()
+
+        self.layer.group_send.assert_called_once()
+        events = self.sent_events(self.layer.group_send.call_args)
+        self.assertEqual(
+            [(event["type"], event["order"]["id"]) for event in events],
+            [("new_order", 1), ("new_order", 2), ("order_bumped", 1)],
+        )
+
+    def test_keeps_latest_update_per_order(self):
+        order = SimpleNamespace(pk=1, status="confirmed")
+
+        with transaction.atomic():
+            services.broadcast_order_updated(order)
+            order.status = "preparing"
+            services.broadcast_order_updated(order)
+
+        events = self.sent_events(self.layer.group_send.call_args)
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]["order"]["status"], "preparing")
+
+    def test_discards_events_on_rollback(self):
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                services.broadcast_new_order(SimpleNamespace(pk=1, status="confirmed"))
+                raise RuntimeError
+
+        self.layer.group_send.assert_not_called()
+
+        # The next transaction starts from an empty buffer
+        with transaction.atomic():
+            services.broadcast_new_order(SimpleNamespace(pk=2, status="confirmed"))
+
+        events = self.sent_events(self.layer.group_send.call_args)
+        self.assertEqual([event["order"]["id"] for event in events], [2])
+
+    def test_discards_events_from_rolled_back_savepoint(self):
+        with transaction.atomic():
+            services.broadcast_new_order(SimpleNamespace(pk=1, status="confirmed"))
+            try:
+                with transaction.atomic():
+                    services.broadcast_new_order(SimpleNamespace(pk=2, status="confirmed"))
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+            services.broadcast_new_order(SimpleNamespace(pk=3, status="confirmed"))
+
+        self.layer.group_send.assert_called_once()
+        events = self.sent_events(self.layer.group_send.call_args)
+        self.assertEqual([event["order"]["id"] for event in events], [1, 3])
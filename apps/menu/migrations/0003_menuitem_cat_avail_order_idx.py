@@ -0,0 +1,20 @@
+# Generated by Django 5.2.9 on 2026-10-16 15:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("menu", "0002_category_outlet"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="menuitem",
+            index=models.Index(
+                fields=["category", "is_available", "display_order"],
+                name="menuitem_cat_avail_order_idx",
+            ),
+        ),
+    ]
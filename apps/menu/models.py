@@ -4,6 +4,12 @@ Menu management models for the Coffee Shop Management System.
 
 from django.db import models
 
+# Cache key for the serialized category -> items tree served to the waiter PWA
+MENU_TREE_CACHE_KEY = "menu_tree_v4"
+
+# Per-item cache key for the waiter add-item availability check
+MENU_ITEM_CACHE_KEY = "menu:item:{}"
+
 
 class Category(models.Model):
     """
@@ -84,6 +90,12 @@ class MenuItem(models.Model):
         verbose_name = "Menu Item"
         verbose_name_plural = "Menu Items"
         ordering = ["display_order", "name"]
+        indexes = [
+            models.Index(
+                fields=["category", "is_available", "display_order"],
+                name="menuitem_cat_avail_order_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} - ₹{self.base_price}"
@@ -0,0 +1,34 @@
+"""
+Signals for menu app - keep cached menu data in sync with edits.
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.menu.models import (
+    MENU_ITEM_CACHE_KEY,
+    MENU_TREE_CACHE_KEY,
+    Category,
+    MenuItem,
+)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=MenuItem)
+@receiver(post_delete, sender=MenuItem)
+def invalidate_menu_tree(sender, **kwargs):
+    """
+    Drop the cached menu tree whenever a category or item changes.
+    """
+    cache.delete(MENU_TREE_CACHE_KEY)
+
+
+@receiver(post_save, sender=MenuItem)
+@receiver(post_delete, sender=MenuItem)
+def invalidate_menu_item_snapshot(sender, instance, **kwargs):
+    """
+    Drop the cached availability snapshot of the changed item.
+    """
+    cache.delete(MENU_ITEM_CACHE_KEY.format(instance.pk))
@@ -2,6 +2,7 @@
 API views for the menu app.
 """
 
+from django.core.cache import cache
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny, IsAuthenticated
@@ -10,7 +11,15 @@ from rest_framework.views import APIView
 
 from apps.accounts.permissions import IsSuperAdmin
 
-from .models import AddOn, AddOnGroup, Category, ComboMeal, MenuItem, MenuItemVariant
+from .models import (
+    MENU_TREE_CACHE_KEY,
+    AddOn,
+    AddOnGroup,
+    Category,
+    ComboMeal,
+    MenuItem,
+    MenuItemVariant,
+)
 from .serializers import (
     AddOnGroupSerializer,
     AddOnSerializer,
@@ -57,6 +66,9 @@ class CategoryViewSet(viewsets.ModelViewSet):
                 display_order=item["display_order"]
             )
 
+        # Queryset updates skip the post_save invalidation
+        cache.delete(MENU_TREE_CACHE_KEY)
+
         return Response({"message": "Categories reordered successfully."})
 
 
@@ -43,15 +43,12 @@ def select_seat(request, table_uuid):
         status__in=[Order.Status.PENDING, Order.Status.CONFIRMED, Order.Status.PREPARING]
     )
 
-    # Extract seat numbers from party_name (format: "Seat X")
-    occupied_seats = []
-    for order in active_orders:
-        if order.party_name and order.party_name.startswith("Seat "):
-            try:
-                seat_num = int(order.party_name.split(" ")[1])
-                occupied_seats.append(seat_num)
-            except (ValueError, IndexError):
-                pass
+    # Seats that already have an order
+    occupied_seats = [
+        seat
+        for seat in active_orders.values_list("seat_number", flat=True)
+        if seat
+    ]
 
     context = {
         "table": table,
@@ -98,7 +95,7 @@ def table_menu(request, table_uuid):
             current_order = Order.objects.get(
                 pk=current_order_id,
                 table=table,
-                party_name=f"Seat {current_seat}",
+                seat_number=current_seat,
                 status__in=[Order.Status.PENDING, Order.Status.CONFIRMED]
             )
         except Order.DoesNotExist:
@@ -155,6 +152,7 @@ def create_order(request, table_uuid):
         customer_name=customer_name,
         customer_phone=customer_phone,
         party_name=f"Seat {current_seat}",
+        seat_number=current_seat,
         status=Order.Status.PENDING if not order_settings.auto_accept_orders else Order.Status.CONFIRMED,
     )
 
@@ -201,7 +199,7 @@ def add_item(request, table_uuid):
         order = Order.objects.get(
             pk=order_id,
             table=table,
-            party_name=f"Seat {current_seat}",
+            seat_number=current_seat,
             status__in=[Order.Status.PENDING, Order.Status.CONFIRMED]
         )
     except Order.DoesNotExist:
@@ -289,7 +287,7 @@ def update_item_quantity(request, table_uuid):
         order = Order.objects.get(
             pk=order_id,
             table=table,
-            party_name=f"Seat {current_seat}",
+            seat_number=current_seat,
             status=Order.Status.PENDING
         )
     except Order.DoesNotExist:
@@ -353,7 +351,7 @@ def submit_order(request, table_uuid):
         order = Order.objects.get(
             pk=order_id,
             table=table,
-            party_name=f"Seat {current_seat}",
+            seat_number=current_seat,
             status=Order.Status.PENDING
         )
 
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.9 on 2026-10-16 13:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("orders", "0004_order_outlet"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                fields=["table", "party_name", "status"],
+                name="order_table_party_status_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                fields=["created_at", "status"], name="order_created_status_idx"
+            ),
+        ),
+    ]
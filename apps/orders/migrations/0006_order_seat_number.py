@@ -0,0 +1,48 @@
+# Generated by Django 5.2.9 on 2026-10-16 14:00
+
+from django.db import migrations, models
+
+
+def backfill_seat_number(apps, schema_editor):
+    """Parse the seat out of existing "Seat N" party names."""
+    Order = apps.get_model("orders", "Order")
+
+    for order in Order.objects.filter(party_name__startswith="Seat ").only(
+        "id", "party_name"
+    ).iterator():
+        try:
+            seat = int(order.party_name.split(" ", 1)[1])
+        except (ValueError, IndexError):
+            continue
+        Order.objects.filter(pk=order.pk).update(seat_number=seat)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("orders", "0005_order_waiter_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="order",
+            name="seat_number",
+            field=models.PositiveSmallIntegerField(
+                blank=True,
+                help_text="Seat this order belongs to (per-seat waiter and QR orders)",
+                null=True,
+            ),
+        ),
+        migrations.RunPython(backfill_seat_number, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name="order",
+            name="order_table_party_status_idx",
+        ),
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                fields=["table", "seat_number", "status"],
+                name="order_table_seat_status_idx",
+            ),
+        ),
+    ]
@@ -108,6 +108,11 @@ class Order(models.Model):
         blank=True,
         help_text="Label for this party/group (e.g., 'Party A', 'Window Side')",
     )
+    seat_number = models.PositiveSmallIntegerField(
+        null=True,
+        blank=True,
+        help_text="Seat this order belongs to (per-seat waiter and QR orders)",
+    )
 
     # Customer info (for QR/online orders or takeaway)
     customer_name = models.CharField(max_length=100, blank=True)
@@ -149,6 +154,14 @@ class Order(models.Model):
         verbose_name = "Order"
         verbose_name_plural = "Orders"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["table", "seat_number", "status"],
+                name="order_table_seat_status_idx",
+            ),
+            models.Index(fields=["created_at", "status"], name="order_created_status_idx"),
+            models.Index(fields=["status", "-created_at"], name="order_status_created_idx"),
+        ]
 
     def __str__(self):
         return f"Order #{self.order_number}"
@@ -201,9 +214,10 @@ class Order(models.Model):
             service_charge_enabled = tax_settings.service_charge_enabled
             service_charge_rate = tax_settings.service_charge_rate
 
-        # Calculate subtotal from items
-        self.subtotal = sum(
-            item.total_price for item in self.items.all()
+        # Calculate subtotal from items (summed in the database)
+        self.subtotal = (
+            self.items.aggregate(total=models.Sum("total_price"))["total"]
+            or Decimal("0")
         )
 
         # Apply discount
@@ -533,3 +547,28 @@ class KitchenOrderTicket(models.Model):
             ).count() + 1
             self.ticket_number = f"K{today_count:03d}"
         super().save(*args, **kwargs)
+
+    @classmethod
+    def bulk_create_for_orders(cls, orders):
+        """
+        Create tickets for many orders with one numbering query and one INSERT.
+        bulk_create() skips post_save, so the kitchen broadcast is sent here,
+        as a single channel layer send for the whole batch.
+        """
+        from apps.kitchen.services import broadcast_new_orders
+
+        today = timezone.now().date()
+        next_number = cls.objects.filter(order__created_at__date=today).count() + 1
+        tickets = cls.objects.bulk_create([
+            cls(order=order, ticket_number=f"K{next_number + offset:03d}")
+            for offset, order in enumerate(orders)
+        ])
+
+        # Cache each ticket on its order and load all lines in one query so
+        # the broadcast payloads need no per-order lookups
+        for ticket in tickets:
+            ticket.order.kitchen_ticket = ticket
+        models.prefetch_related_objects(orders, "items")
+        broadcast_new_orders(orders)
+
+        return tickets
@@ -5,3 +5,6 @@ class TablesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.tables"
     verbose_name = "Table Management"
+
+    def ready(self):
+        import apps.tables.signals  # noqa: F401
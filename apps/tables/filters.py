@@ -0,0 +1,47 @@
+"""
+Filter sets for the tables app.
+"""
+
+import django_filters
+
+from .models import Floor, Table, TableSession
+
+
+class FloorFilter(django_filters.FilterSet):
+    """
+    Filters for the floor list.
+    """
+
+    is_active = django_filters.BooleanFilter()
+
+    class Meta:
+        model = Floor
+        fields = ["is_active"]
+
+
+class TableFilter(django_filters.FilterSet):
+    """
+    Filters for the table list.
+    """
+
+    floor = django_filters.NumberFilter(field_name="floor_id")
+    status = django_filters.ChoiceFilter(choices=Table.Status.choices)
+    is_active = django_filters.BooleanFilter()
+
+    class Meta:
+        model = Table
+        fields = ["floor", "status", "is_active"]
+
+
+class TableSessionFilter(django_filters.FilterSet):
+    """
+    Filters for the table session list.
+    """
+
+    table = django_filters.NumberFilter(field_name="table_id")
+    waiter = django_filters.NumberFilter(field_name="waiter_id")
+    is_active = django_filters.BooleanFilter()
+
+    class Meta:
+        model = TableSession
+        fields = ["table", "waiter", "is_active"]
@@ -5,7 +5,7 @@ Management command to generate QR codes for tables that don't have them.
 from django.core.management.base import BaseCommand
 
 from apps.tables.models import Table
-from apps.tables.utils import generate_table_qr_code
+from apps.tables.utils import store_table_qr_code
 
 
 class Command(BaseCommand):
@@ -35,7 +35,7 @@ class Command(BaseCommand):
 
         if not regenerate_all:
             # Only tables without QR codes
-            tables = tables.filter(qr_code='')
+            tables = tables.filter(qr_image__isnull=True)
 
         total = tables.count()
 
@@ -52,8 +52,7 @@ class Command(BaseCommand):
 
         for table in tables:
             try:
-                qr_file = generate_table_qr_code(table)
-                table.qr_code.save(qr_file.name, qr_file, save=True)
+                store_table_qr_code(table)
                 success_count += 1
                 self.stdout.write(
                     self.style.SUCCESS(f'  Generated QR for table {table.number} ({table.floor.name})')
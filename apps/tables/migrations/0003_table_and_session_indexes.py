@@ -0,0 +1,47 @@
+# Generated by Django 5.2.9 on 2026-10-16 09:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("tables", "0002_floor_outlet"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="table",
+            index=models.Index(
+                fields=["floor", "status"], name="table_floor_status_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="table",
+            index=models.Index(
+                fields=["status", "is_active"], name="table_status_active_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="table",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["uuid"],
+                name="table_active_uuid_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="tablesession",
+            index=models.Index(
+                fields=["table", "is_active"], name="session_table_active_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="tablesession",
+            index=models.Index(
+                fields=["waiter", "is_active"], name="session_waiter_active_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.9 on 2026-10-16 10:00
+
+from django.db import migrations, models
+
+
+def copy_qr_files_to_rows(apps, schema_editor):
+    """Copy existing QR code PNG files into the new binary column."""
+    Table = apps.get_model("tables", "Table")
+    for table in Table.objects.exclude(qr_code="").exclude(qr_code__isnull=True):
+        try:
+            with table.qr_code.open("rb") as qr_file:
+                table.qr_image = qr_file.read()
+        except (OSError, ValueError):
+            # Missing file: the image is regenerated on first request
+            continue
+        table.save(update_fields=["qr_image"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tables", "0003_table_and_session_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="table",
+            name="qr_image",
+            field=models.BinaryField(
+                blank=True,
+                editable=False,
+                help_text="PNG bytes of the table's QR code",
+                null=True,
+            ),
+        ),
+        migrations.RunPython(copy_qr_files_to_rows, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name="table",
+            name="qr_code",
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.9 on 2026-10-16 11:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tables", "0004_table_qr_image"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="tablesession",
+            name="duration_minutes_cached",
+            field=models.PositiveIntegerField(
+                blank=True,
+                editable=False,
+                help_text="Session length, stored when the session ends",
+                null=True,
+            ),
+        ),
+    ]
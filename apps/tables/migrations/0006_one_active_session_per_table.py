@@ -0,0 +1,40 @@
+# Generated by Django 5.2.9 on 2026-10-16 12:00
+
+from django.db import migrations, models
+
+
+def close_duplicate_active_sessions(apps, schema_editor):
+    """Keep only the newest active session per table before adding the constraint."""
+    TableSession = apps.get_model("tables", "TableSession")
+    seen_tables = set()
+    active_sessions = TableSession.objects.filter(is_active=True).order_by(
+        "table_id", "-started_at"
+    )
+    for session in active_sessions:
+        if session.table_id in seen_tables:
+            session.is_active = False
+            session.ended_at = session.ended_at or session.started_at
+            session.save(update_fields=["is_active", "ended_at"])
+        else:
+            seen_tables.add(session.table_id)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tables", "0005_tablesession_duration_minutes_cached"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            close_duplicate_active_sessions, migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name="tablesession",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("is_active", True)),
+                fields=("table",),
+                name="one_active_session_per_table",
+            ),
+        ),
+    ]
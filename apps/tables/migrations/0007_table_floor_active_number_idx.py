@@ -0,0 +1,20 @@
+# Generated by Django 5.2.9 on 2026-10-16 15:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tables", "0006_one_active_session_per_table"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="table",
+            index=models.Index(
+                fields=["floor", "is_active", "number"],
+                name="table_floor_active_number_idx",
+            ),
+        ),
+    ]
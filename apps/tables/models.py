@@ -104,10 +104,11 @@ class Table(models.Model):
         editable=False,
         unique=True,
     )
-    qr_code = models.ImageField(
-        upload_to="qr_codes/",
+    qr_image = models.BinaryField(
         null=True,
         blank=True,
+        editable=False,
+        help_text="PNG bytes of the table's QR code",
     )
 
     # Floor map positioning
@@ -123,6 +124,19 @@ class Table(models.Model):
         verbose_name_plural = "Tables"
         unique_together = ["floor", "number"]
         ordering = ["floor", "number"]
+        indexes = [
+            models.Index(fields=["floor", "status"], name="table_floor_status_idx"),
+            models.Index(fields=["status", "is_active"], name="table_status_active_idx"),
+            models.Index(
+                fields=["floor", "is_active", "number"],
+                name="table_floor_active_number_idx",
+            ),
+            models.Index(
+                fields=["uuid"],
+                condition=models.Q(is_active=True),
+                name="table_active_uuid_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.number} ({self.floor.name})"
@@ -137,15 +151,60 @@ class Table(models.Model):
         """Get QR code URL for customer ordering."""
         return f"/order/t/{self.uuid}/"
 
+    @property
+    def qr_code_url(self):
+        """Get the URL serving this table's QR code image."""
+        return f"/api/v1/tables/qr/{self.uuid}/image.png"
+
     @property
     def current_session(self):
         """Get the current active session for this table."""
         return self.sessions.filter(is_active=True).first()
 
+    @staticmethod
+    def public_cache_key(table_uuid):
+        """Cache key for the public QR landing payload of a table."""
+        return f"public_table:{table_uuid}"
+
+    @classmethod
+    def invalidate_public_caches(cls, table_uuids):
+        """Drop the cached public QR landing payloads for these table uuids."""
+        from django.core.cache import cache
+
+        cache.delete_many([cls.public_cache_key(table_uuid) for table_uuid in table_uuids])
+
+    def invalidate_public_cache(self):
+        """Drop the cached public QR landing payload for this table."""
+        self.invalidate_public_caches([self.uuid])
+
+    @classmethod
+    def bulk_set_status(cls, tables, status):
+        """
+        Set the status of every table in a queryset with one UPDATE and drop
+        their cached public payloads. Use this instead of a bare
+        ``update(status=...)`` so the QR landing page never shows a stale status.
+        """
+        from django.utils import timezone
+
+        table_uuids = list(tables.values_list("uuid", flat=True))
+        if not table_uuids:
+            return 0
+
+        updated = cls.objects.filter(uuid__in=table_uuids).update(
+            status=status, updated_at=timezone.now()
+        )
+        cls.invalidate_public_caches(table_uuids)
+        return updated
+
     def set_status(self, status):
-        """Update table status."""
+        """Update table status with a single UPDATE (no validation or signals)."""
+        from django.utils import timezone
+
+        now = timezone.now()
+        Table.objects.filter(pk=self.pk).update(status=status, updated_at=now)
         self.status = status
-        self.save(update_fields=["status", "updated_at"])
+        self.updated_at = now
+        self.invalidate_public_cache()
 
     def clean(self):
         """Validate table creation against plan limits."""
@@ -158,11 +217,12 @@ class Table(models.Model):
         if max_tables == 0:
             return
 
-        # Check if this is a new table (no pk yet)
-        if not self.pk and self.floor and self.floor.outlet:
-            outlet = self.floor.outlet
-            current_count = Table.objects.filter(floor__outlet=outlet).count()
-            if current_count >= max_tables:
+        # Only new tables count against the plan limit
+        if self._state.adding and self.floor_id and self.floor.outlet_id:
+            limit_reached = Table.objects.filter(
+                floor__outlet_id=self.floor.outlet_id
+            )[max_tables - 1:max_tables].exists()
+            if limit_reached:
                 plan_name = getattr(django_settings, "PLAN_NAME", "current")
                 raise ValidationError(
                     f"Cannot create more tables. Your {plan_name} plan allows maximum {max_tables} table(s) per outlet. "
@@ -170,9 +230,11 @@ class Table(models.Model):
                 )
 
     def save(self, *args, **kwargs):
-        """Save with validation."""
-        self.full_clean()
+        """Save with validation (skipped for partial ``update_fields`` saves)."""
+        if not kwargs.get("update_fields"):
+            self.full_clean()
         super().save(*args, **kwargs)
+        self.invalidate_public_cache()
 
     @classmethod
     def can_create_table(cls, outlet):
@@ -182,7 +244,10 @@ class Table(models.Model):
         max_tables = getattr(django_settings, "MAX_TABLES_PER_OUTLET", 0)
         if max_tables == 0:  # Unlimited
             return True
-        return cls.objects.filter(floor__outlet=outlet).count() < max_tables
+        # OFFSET/LIMIT 1 probe instead of counting every table
+        return not cls.objects.filter(floor__outlet_id=outlet.pk)[
+            max_tables - 1:max_tables
+        ].exists()
 
     @classmethod
     def tables_remaining(cls, outlet):
@@ -192,7 +257,35 @@ class Table(models.Model):
         max_tables = getattr(django_settings, "MAX_TABLES_PER_OUTLET", 0)
         if max_tables == 0:  # Unlimited
             return float("inf")
-        return max(0, max_tables - cls.objects.filter(floor__outlet=outlet).count())
+        return max(0, max_tables - cls.objects.filter(floor__outlet_id=outlet.pk).count())
+
+    @classmethod
+    def bulk_create_for_floor(cls, floor, rows, batch_size=500):
+        """
+        Create many tables on a floor in batched INSERTs.
+
+        The plan limit is checked once for the whole batch instead of
+        running ``full_clean`` per row.
+
+        Args:
+            floor: Floor the tables belong to
+            rows: Iterable of dicts of Table field values (number, capacity, ...)
+            batch_size: Rows per INSERT statement
+        """
+        from django.conf import settings as django_settings
+        from django.core.exceptions import ValidationError
+
+        tables = [cls(floor=floor, **row) for row in rows]
+
+        if floor.outlet_id and len(tables) > cls.tables_remaining(floor.outlet):
+            max_tables = cls.get_max_tables()
+            plan_name = getattr(django_settings, "PLAN_NAME", "current")
+            raise ValidationError(
+                f"Cannot create {len(tables)} tables. Your {plan_name} plan allows maximum {max_tables} table(s) per outlet. "
+                f"Contact your vendor to upgrade."
+            )
+
+        return cls.objects.bulk_create(tables, batch_size=batch_size)
 
     @classmethod
     def get_max_tables(cls):
@@ -230,6 +323,12 @@ class TableSession(models.Model):
     started_at = models.DateTimeField(auto_now_add=True)
     ended_at = models.DateTimeField(null=True, blank=True)
     is_active = models.BooleanField(default=True)
+    duration_minutes_cached = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Session length, stored when the session ends",
+    )
 
     notes = models.TextField(blank=True)
 
@@ -237,13 +336,27 @@ class TableSession(models.Model):
         verbose_name = "Table Session"
         verbose_name_plural = "Table Sessions"
         ordering = ["-started_at"]
+        indexes = [
+            models.Index(fields=["table", "is_active"], name="session_table_active_idx"),
+            models.Index(fields=["waiter", "is_active"], name="session_waiter_active_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["table"],
+                condition=models.Q(is_active=True),
+                name="one_active_session_per_table",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.table.number} - {self.started_at.strftime('%Y-%m-%d %H:%M')}"
 
     @property
     def duration_minutes(self):
-        """Calculate session duration in minutes."""
+        """Session duration in minutes (stored once the session has ended)."""
+        if self.ended_at and self.duration_minutes_cached is not None:
+            return self.duration_minutes_cached
+
         from django.utils import timezone
 
         end_time = self.ended_at or timezone.now()
@@ -256,7 +369,14 @@ class TableSession(models.Model):
 
         self.ended_at = timezone.now()
         self.is_active = False
-        self.save(update_fields=["ended_at", "is_active"])
+        self.duration_minutes_cached = int(
+            (self.ended_at - self.started_at).total_seconds() / 60
+        )
+        TableSession.objects.filter(pk=self.pk).update(
+            ended_at=self.ended_at,
+            is_active=False,
+            duration_minutes_cached=self.duration_minutes_cached,
+        )
 
         # Update table status
         self.table.set_status(Table.Status.CLEANING)
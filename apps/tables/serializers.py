@@ -41,6 +41,7 @@ class TableSerializer(serializers.ModelSerializer):
     table_type_display = serializers.CharField(source="get_table_type_display", read_only=True)
     display_name = serializers.ReadOnlyField()
     qr_url = serializers.ReadOnlyField()
+    qr_code = serializers.ReadOnlyField(source="qr_code_url")
     has_active_session = serializers.SerializerMethodField()
 
     class Meta:
@@ -70,6 +71,9 @@ class TableSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "uuid", "created_at", "updated_at"]
 
     def get_has_active_session(self, obj):
+        # List querysets annotate this to avoid one EXISTS query per row
+        if hasattr(obj, "active_session_exists"):
+            return obj.active_session_exists
         return obj.sessions.filter(is_active=True).exists()
 
 
@@ -139,37 +143,6 @@ class StartSessionSerializer(serializers.Serializer):
     notes = serializers.CharField(required=False, allow_blank=True)
 
 
-class FloorMapTableSerializer(serializers.ModelSerializer):
-    """
-    Minimal serializer for floor map display.
-    """
-
-    class Meta:
-        model = Table
-        fields = [
-            "id",
-            "number",
-            "name",
-            "capacity",
-            "status",
-            "table_type",
-            "position_x",
-            "position_y",
-        ]
-
-
-class FloorMapSerializer(serializers.ModelSerializer):
-    """
-    Serializer for floor map view.
-    """
-
-    tables = FloorMapTableSerializer(many=True, read_only=True)
-
-    class Meta:
-        model = Floor
-        fields = ["id", "name", "tables"]
-
-
 # ============================================================================
 # Public Table Serializers (for QR ordering)
 # ============================================================================
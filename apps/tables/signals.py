@@ -0,0 +1,17 @@
+"""
+Signals for tables app - keep cached public table payloads in sync.
+"""
+
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from apps.tables.models import Table
+
+
+@receiver(post_delete, sender=Table)
+def invalidate_public_table(sender, instance, **kwargs):
+    """
+    Drop a deleted table's cached QR landing payload, including tables
+    removed by a floor cascade or a queryset delete.
+    """
+    instance.invalidate_public_cache()
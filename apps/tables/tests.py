@@ -1,3 +1,89 @@
+from django.core.cache import cache
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from apps.accounts.models import User
+
+from .models import Floor, Table, TableSession
+
+
+class TableQRImageViewTests(TestCase):
+    def setUp(self):
+        floor = Floor.objects.create(name="Main Floor")
+        self.table = Table.objects.create(floor=floor, number="T1", capacity=4)
+
+    def get_image(self, table):
+        return self.client.get(reverse("table_qr_image", args=[table.uuid]))
+
+    def test_serves_stored_image(self):
+        Table.objects.filter(pk=self.table.pk).update(qr_image=b"png-bytes")
+
+        response = self.get_image(self.table)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "image/png")
+        self.assertEqual(response.content, b"png-bytes")
+
+    def test_missing_image_is_not_generated(self):
+        response = self.get_image(self.table)
+
+        self.assertEqual(response.status_code, 404)
+        self.table.refresh_from_db()
+        self.assertFalse(self.table.qr_image)
+
+    def test_inactive_table_not_found(self):
+        Table.objects.filter(pk=self.table.pk).update(
+            qr_image=b"png-bytes", is_active=False
+        )
+
+        self.assertEqual(self.get_image(self.table).status_code, 404)
+
+
+class PublicTableCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        floor = Floor.objects.create(name="Main Floor")
+        self.table = Table.objects.create(floor=floor, number="T1", capacity=4)
+        self.url = reverse("public_table", args=[self.table.uuid])
+
+    def test_delete_drops_cached_payload(self):
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+
+        self.table.delete()
+
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+
+    def test_queryset_delete_drops_cached_payload(self):
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+
+        Table.objects.filter(pk=self.table.pk).delete()
+
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+
+
+class StartSessionViewTests(TestCase):
+    def setUp(self):
+        floor = Floor.objects.create(name="Main Floor")
+        self.table = Table.objects.create(floor=floor, number="T1", capacity=4)
+        self.client = APIClient()
+        self.client.force_authenticate(
+            User.objects.create_user(username="waiter", role=User.Role.WAITER)
+        )
+        self.url = reverse("start_session", args=[self.table.pk])
+
+    def test_starts_session_and_occupies_table(self):
+        response = self.client.post(self.url, {"guest_count": 2}, format="json")
+
+        self.assertEqual(response.status_code, 201)
+        self.table.refresh_from_db()
+        self.assertEqual(self.table.status, Table.Status.OCCUPIED)
+
+    def test_second_active_session_rejected(self):
+        self.assertEqual(self.client.post(self.url, {}, format="json").status_code, 201)
+
+        response = self.client.post(self.url, {}, format="json")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["error"], "Table already has an active session.")
+        self.assertEqual(TableSession.objects.filter(table=self.table).count(), 1)
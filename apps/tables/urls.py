@@ -3,7 +3,7 @@ URL configuration for the tables app.
 """
 
 from django.urls import include, path
-from rest_framework.routers import DefaultRouter
+from rest_framework.routers import SimpleRouter
 
 from .views import (
     EndSessionView,
@@ -11,11 +11,12 @@ from .views import (
     FloorViewSet,
     PublicTableView,
     StartSessionView,
+    TableQRImageView,
     TableSessionViewSet,
     TableViewSet,
 )
 
-router = DefaultRouter()
+router = SimpleRouter()
 router.register(r"floors", FloorViewSet, basename="floor")
 router.register(r"tables", TableViewSet, basename="table")
 router.register(r"sessions", TableSessionViewSet, basename="session")
@@ -28,6 +29,11 @@ urlpatterns = [
     path("<int:table_id>/session/end/", EndSessionView.as_view(), name="end_session"),
     # Public QR landing
     path("qr/<uuid:table_uuid>/", PublicTableView.as_view(), name="public_table"),
+    path(
+        "qr/<uuid:table_uuid>/image.png",
+        TableQRImageView.as_view(),
+        name="table_qr_image",
+    ),
     # Router URLs
     path("", include(router.urls)),
 ]
@@ -3,14 +3,44 @@ Utility functions for the tables app.
 """
 
 import io
-import os
+from functools import lru_cache
 
 import qrcode
 from django.conf import settings
-from django.core.files.base import ContentFile
 from PIL import Image
 
 
+@lru_cache(maxsize=512)
+def render_qr_png(data):
+    """
+    Render ``data`` as a PNG QR code and return the raw bytes.
+
+    Results are memoized per URL, so re-rendering the same table's code
+    (e.g. bulk regeneration or repeated downloads) skips the Reed-Solomon
+    encoding and PNG compression entirely.
+    """
+    qr = qrcode.QRCode(
+        version=None,
+        error_correction=qrcode.constants.ERROR_CORRECT_H,
+        box_size=10,
+        border=4,
+    )
+    qr.add_data(data)
+    qr.make(fit=True)
+
+    # Create image with custom colors
+    img = qr.make_image(fill_color="#1e293b", back_color="white")
+
+    # Convert to PIL Image if not already
+    if not isinstance(img, Image.Image):
+        img = img.get_image()
+
+    # Fast zlib level: QR codes are two-colour and compress well regardless
+    buffer = io.BytesIO()
+    img.save(buffer, format='PNG', optimize=False, compress_level=1)
+    return buffer.getvalue()
+
+
 def generate_table_qr_code(table, base_url=None):
     """
     Generate a QR code for a table that links to the customer ordering page.
@@ -20,7 +50,7 @@ def generate_table_qr_code(table, base_url=None):
         base_url: Base URL for the ordering system (optional)
 
     Returns:
-        ContentFile containing the QR code image
+        PNG image bytes
     """
     if base_url is None:
         # Use the site URL from settings or default
@@ -29,32 +59,23 @@ def generate_table_qr_code(table, base_url=None):
     # The URL that customers will scan to order
     order_url = f"{base_url}/order/t/{table.uuid}/"
 
-    # Create QR code
-    qr = qrcode.QRCode(
-        version=1,
-        error_correction=qrcode.constants.ERROR_CORRECT_H,
-        box_size=10,
-        border=4,
-    )
-    qr.add_data(order_url)
-    qr.make(fit=True)
+    return render_qr_png(order_url)
 
-    # Create image with custom colors
-    img = qr.make_image(fill_color="#1e293b", back_color="white")
 
-    # Convert to PIL Image if not already
-    if not isinstance(img, Image.Image):
-        img = img.get_image()
+def store_table_qr_code(table, base_url=None):
+    """
+    Generate a table's QR code and store the PNG bytes on its row.
 
-    # Save to buffer
-    buffer = io.BytesIO()
-    img.save(buffer, format='PNG')
-    buffer.seek(0)
+    Args:
+        table: Table model instance
+        base_url: Base URL for the ordering system (optional)
+    """
+    from .models import Table
 
-    # Create filename
-    filename = f"qr_table_{table.number}_{table.uuid}.png"
+    table.qr_image = generate_table_qr_code(table, base_url)
+    Table.objects.filter(pk=table.pk).update(qr_image=table.qr_image)
 
-    return ContentFile(buffer.read(), name=filename)
+    return table
 
 
 def regenerate_table_qr_code(table, base_url=None):
@@ -67,20 +88,12 @@ def regenerate_table_qr_code(table, base_url=None):
     """
     import uuid as uuid_module
 
-    # Generate new UUID
+    # Generate new UUID (the old QR landing payload must stop resolving)
+    table.invalidate_public_cache()
     table.uuid = uuid_module.uuid4()
 
-    # Delete old QR code if exists
-    if table.qr_code:
-        try:
-            if os.path.isfile(table.qr_code.path):
-                os.remove(table.qr_code.path)
-        except Exception:
-            pass
-
-    # Generate new QR code
-    qr_file = generate_table_qr_code(table, base_url)
-    table.qr_code.save(qr_file.name, qr_file, save=False)
-    table.save()
+    # Generate new QR code (replaces the old bytes in the same row)
+    table.qr_image = generate_table_qr_code(table, base_url)
+    table.save(update_fields=["uuid", "qr_image", "updated_at"])
 
     return table
@@ -2,6 +2,12 @@
 API views for the tables app.
 """
 
+from collections import defaultdict
+
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Exists, OuterRef, Prefetch
+from django.http import HttpResponse
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny, IsAuthenticated
@@ -10,9 +16,9 @@ from rest_framework.views import APIView
 
 from apps.accounts.permissions import IsAdminOrWaiter, IsSuperAdmin
 
+from .filters import FloorFilter, TableFilter, TableSessionFilter
 from .models import Floor, Table, TableSession
 from .serializers import (
-    FloorMapSerializer,
     FloorSerializer,
     PublicTableSerializer,
     StartSessionSerializer,
@@ -21,6 +27,53 @@ from .serializers import (
     TableSessionSerializer,
     TableStatusUpdateSerializer,
 )
+from .utils import regenerate_table_qr_code, store_table_qr_code
+
+# Column projections for list endpoints (related rows are trimmed to what
+# the serializers actually read)
+TABLE_LIST_FIELDS = (
+    "id",
+    "floor",
+    "number",
+    "name",
+    "capacity",
+    "table_type",
+    "status",
+    "uuid",
+    "position_x",
+    "position_y",
+    "is_active",
+    "created_at",
+    "updated_at",
+)
+
+SESSION_LIST_FIELDS = (
+    "id",
+    "table",
+    "table__number",
+    "waiter",
+    "waiter__first_name",
+    "waiter__last_name",
+    "customer_name",
+    "customer_phone",
+    "guest_count",
+    "started_at",
+    "ended_at",
+    "is_active",
+    "duration_minutes_cached",
+    "notes",
+)
+
+FLOOR_MAP_TABLE_FIELDS = (
+    "id",
+    "number",
+    "name",
+    "capacity",
+    "status",
+    "table_type",
+    "position_x",
+    "position_y",
+)
 
 
 class FloorViewSet(viewsets.ModelViewSet):
@@ -30,25 +83,17 @@ class FloorViewSet(viewsets.ModelViewSet):
 
     queryset = Floor.objects.all()
     serializer_class = FloorSerializer
+    filterset_class = FloorFilter
     permission_classes = [IsAuthenticated, IsSuperAdmin]
 
-    def get_queryset(self):
-        queryset = super().get_queryset()
-
-        # Filter by active status
-        is_active = self.request.query_params.get("is_active")
-        if is_active is not None:
-            queryset = queryset.filter(is_active=is_active.lower() == "true")
-
-        return queryset
-
 
 class TableViewSet(viewsets.ModelViewSet):
     """
     CRUD operations for tables.
     """
 
-    queryset = Table.objects.select_related("floor").all()
+    queryset = Table.objects.all()
+    filterset_class = TableFilter
     permission_classes = [IsAuthenticated]
 
     def get_serializer_class(self):
@@ -64,23 +109,31 @@ class TableViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         queryset = super().get_queryset()
 
-        # Filter by floor
-        floor = self.request.query_params.get("floor")
-        if floor:
-            queryset = queryset.filter(floor_id=floor)
-
-        # Filter by status
-        table_status = self.request.query_params.get("status")
-        if table_status:
-            queryset = queryset.filter(status=table_status)
-
-        # Filter by active
-        is_active = self.request.query_params.get("is_active")
-        if is_active is not None:
-            queryset = queryset.filter(is_active=is_active.lower() == "true")
+        if self.action == "list":
+            # Many tables share few floors: fetch each floor's name once in a
+            # second query instead of repeating floor columns on every row
+            queryset = (
+                queryset.only(*TABLE_LIST_FIELDS)
+                .prefetch_related(
+                    Prefetch("floor", queryset=Floor.objects.only("id", "name"))
+                )
+                .annotate(
+                    active_session_exists=Exists(
+                        TableSession.objects.filter(
+                            table=OuterRef("pk"), is_active=True
+                        )
+                    )
+                )
+            )
+        else:
+            queryset = queryset.select_related("floor")
 
         return queryset
 
+    def perform_create(self, serializer):
+        table = serializer.save()
+        store_table_qr_code(table)
+
     @action(detail=True, methods=["post"])
     def update_status(self, request, pk=None):
         """Update table status."""
@@ -103,32 +156,30 @@ class TableViewSet(viewsets.ModelViewSet):
         """Get or generate QR code for table."""
         table = self.get_object()
 
-        # TODO: Generate QR code if not exists
-
         return Response(
             {
                 "table": table.number,
                 "uuid": str(table.uuid),
                 "qr_url": table.qr_url,
-                "qr_code": table.qr_code.url if table.qr_code else None,
+                "qr_code": table.qr_code_url,
             }
         )
 
     @action(detail=True, methods=["post"])
     def regenerate_qr(self, request, pk=None):
         """Regenerate QR code for table."""
-        import uuid
-
         table = self.get_object()
-        table.uuid = uuid.uuid4()
-        table.qr_code = None  # Will be regenerated
-        table.save()
+
+        # New uuid and image are written together in one UPDATE
+        with transaction.atomic():
+            regenerate_table_qr_code(table)
 
         return Response(
             {
                 "message": f"QR code regenerated for table {table.number}.",
                 "uuid": str(table.uuid),
                 "qr_url": table.qr_url,
+                "qr_code": table.qr_code_url,
             }
         )
 
@@ -141,9 +192,21 @@ class FloorMapView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        floors = Floor.objects.filter(is_active=True).prefetch_related("tables")
-        serializer = FloorMapSerializer(floors, many=True)
-        return Response(serializer.data)
+        # Read-only projection: plain dicts, no model instances or serializers
+        floors = list(Floor.objects.filter(is_active=True).values("id", "name"))
+        tables_by_floor = defaultdict(list)
+        tables = (
+            Table.objects.filter(floor_id__in=[floor["id"] for floor in floors])
+            .order_by("number")
+            .values("floor_id", *FLOOR_MAP_TABLE_FIELDS)
+        )
+        for table in tables:
+            tables_by_floor[table.pop("floor_id")].append(table)
+
+        for floor in floors:
+            floor["tables"] = tables_by_floor[floor["id"]]
+
+        return Response(floors)
 
 
 class TableSessionViewSet(viewsets.ModelViewSet):
@@ -153,25 +216,15 @@ class TableSessionViewSet(viewsets.ModelViewSet):
 
     queryset = TableSession.objects.select_related("table", "waiter").all()
     serializer_class = TableSessionSerializer
+    filterset_class = TableSessionFilter
     permission_classes = [IsAuthenticated, IsAdminOrWaiter]
 
     def get_queryset(self):
         queryset = super().get_queryset()
 
-        # Filter by table
-        table = self.request.query_params.get("table")
-        if table:
-            queryset = queryset.filter(table_id=table)
-
-        # Filter by active sessions only
-        is_active = self.request.query_params.get("is_active")
-        if is_active is not None:
-            queryset = queryset.filter(is_active=is_active.lower() == "true")
-
-        # Filter by waiter
-        waiter = self.request.query_params.get("waiter")
-        if waiter:
-            queryset = queryset.filter(waiter_id=waiter)
+        if self.action == "list":
+            # Only table number and waiter name are serialized from the joins
+            queryset = queryset.only(*SESSION_LIST_FIELDS)
 
         return queryset
 
@@ -191,25 +244,27 @@ class StartSessionView(APIView):
                 {"error": "Table not found."}, status=status.HTTP_404_NOT_FOUND
             )
 
-        # Check if table already has active session
-        if table.current_session:
+        serializer = StartSessionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        # The one_active_session_per_table constraint rejects a second
+        # active session, so no pre-check query is needed
+        try:
+            with transaction.atomic():
+                session = TableSession.objects.create(
+                    table=table,
+                    waiter=request.user,
+                    customer_name=serializer.validated_data.get("customer_name", ""),
+                    customer_phone=serializer.validated_data.get("customer_phone", ""),
+                    guest_count=serializer.validated_data.get("guest_count", 1),
+                    notes=serializer.validated_data.get("notes", ""),
+                )
+        except IntegrityError:
             return Response(
                 {"error": "Table already has an active session."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        serializer = StartSessionSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-
-        session = TableSession.objects.create(
-            table=table,
-            waiter=request.user,
-            customer_name=serializer.validated_data.get("customer_name", ""),
-            customer_phone=serializer.validated_data.get("customer_phone", ""),
-            guest_count=serializer.validated_data.get("guest_count", 1),
-            notes=serializer.validated_data.get("notes", ""),
-        )
-
         # Update table status
         table.set_status(Table.Status.OCCUPIED)
 
@@ -237,13 +292,17 @@ class EndSessionView(APIView):
                 {"error": "Table not found."}, status=status.HTTP_404_NOT_FOUND
             )
 
-        session = table.current_session
+        session = (
+            table.sessions.select_related("waiter").filter(is_active=True).first()
+        )
         if not session:
             return Response(
                 {"error": "No active session for this table."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        # Reuse the loaded table so end_session and the serializer skip the FK fetch
+        session.table = table
         session.end_session()
 
         return Response(
@@ -265,22 +324,56 @@ class PublicTableView(APIView):
     """
 
     permission_classes = [AllowAny]
+    cache_timeout = 30
 
     def get(self, request, table_uuid):
-        try:
-            table = Table.objects.select_related("floor").get(
-                uuid=table_uuid, is_active=True
-            )
-        except Table.DoesNotExist:
-            return Response(
-                {"error": "Invalid QR code or table not found."},
-                status=status.HTTP_404_NOT_FOUND,
-            )
-
-        return Response(
-            {
+        cache_key = Table.public_cache_key(table_uuid)
+        data = cache.get(cache_key)
+
+        if data is None:
+            try:
+                table = (
+                    Table.objects.select_related("floor")
+                    .only("id", "uuid", "number", "name", "capacity", "status", "floor__name")
+                    .get(uuid=table_uuid, is_active=True)
+                )
+            except Table.DoesNotExist:
+                return Response(
+                    {"error": "Invalid QR code or table not found."},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+
+            data = {
                 "table": PublicTableSerializer(table).data,
                 "can_order": table.status
                 in [Table.Status.OCCUPIED, Table.Status.VACANT],
             }
+            cache.set(cache_key, data, self.cache_timeout)
+
+        return Response(data)
+
+
+class TableQRImageView(APIView):
+    """
+    Serve a table's QR code PNG straight from the database row.
+    Read-only: images are stored when a table is created or its QR code is
+    regenerated.
+    """
+
+    permission_classes = [AllowAny]
+
+    def get(self, request, table_uuid):
+        table = (
+            Table.objects.filter(uuid=table_uuid, is_active=True)
+            .only("id", "qr_image")
+            .first()
         )
+        if table is None or not table.qr_image:
+            return Response(
+                {"error": "QR code not found."}, status=status.HTTP_404_NOT_FOUND
+            )
+
+        response = HttpResponse(bytes(table.qr_image), content_type="image/png")
+        # The image is keyed by uuid, which changes whenever it is regenerated
+        response["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
@@ -1,3 +1,167 @@
+from decimal import Decimal
+from unittest import mock
+
+import orjson
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.accounts.models import User
+from apps.core.models import TaxSettings
+from apps.menu.models import Category, MenuItem
+from apps.orders.models import Order
+from apps.tables.models import Floor, Table
+from apps.waiter import views
+
+
+class WaiterAPITestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="waiter", password="secret", role=User.Role.WAITER
+        )
+        self.client.force_login(self.user)
+
+    def post_json(self, url, data):
+        return self.client.post(
+            url, orjson.dumps(data), content_type="application/json"
+        )
+
+
+class SyncOrdersValidationTests(WaiterAPITestCase):
+    url = reverse("waiter:api_sync_orders")
+
+    def test_rejects_non_list_orders(self):
+        for payload in ({"orders": {"table_id": 1}}, {"orders": "x"}, ["x"]):
+            with self.subTest(payload=payload):
+                response = self.post_json(self.url, payload)
+                self.assertEqual(response.status_code, 400)
+
+    def test_accepts_empty_batch(self):
+        response = self.post_json(self.url, {"orders": []})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(orjson.loads(response.content)["results"], [])
+
+
+class SyncOrdersBatchTests(WaiterAPITestCase):
+    url = reverse("waiter:api_sync_orders")
+
+    def setUp(self):
+        super().setUp()
+        # Stored row, so totals read Decimal rates rather than field defaults
+        TaxSettings.objects.create()
+        floor = Floor.objects.create(name="Main Floor")
+        self.first_table = Table.objects.create(floor=floor, number="T1", capacity=4)
+        self.second_table = Table.objects.create(floor=floor, number="T2", capacity=4)
+        category = Category.objects.create(name="Coffee")
+        self.menu_item = MenuItem.objects.create(
+            category=category, name="Latte", base_price=Decimal("120.00")
+        )
+
+    def offline_order(self, table, offline_id):
+        return {
+            "table_id": table.pk,
+            "seat": 1,
+            "offline_id": offline_id,
+            "items": [{"menu_item_id": self.menu_item.pk, "quantity": 2}],
+        }
+
+    def sync(self, *orders):
+        response = self.post_json(self.url, {"orders": list(orders)})
+        self.assertEqual(response.status_code, 200)
+        return orjson.loads(response.content)["results"]
+
+    def test_failed_order_rolls_back_only_itself(self):
+        add_items = views._add_items_to_order
+
+        def fail_second_table(order, *args, **kwargs):
+            if order.table_id == self.second_table.pk:
+                raise RuntimeError("boom")
+            return add_items(order, *args, **kwargs)
+
+        with mock.patch.object(views, "_add_items_to_order", side_effect=fail_second_table):
+            results = self.sync(
+                self.offline_order(self.first_table, "a"),
+                self.offline_order(self.second_table, "b"),
+            )
+
+        self.assertEqual(
+            [(result["offline_id"], result["success"]) for result in results],
+            [("a", True), ("b", False)],
+        )
+        # The order row created before the failure went with its savepoint
+        self.assertFalse(Order.objects.filter(table=self.second_table).exists())
+        order = Order.objects.get(table=self.first_table)
+        self.assertEqual(order.items.get().quantity, 2)
+
+        self.second_table.refresh_from_db()
+        self.assertEqual(self.second_table.status, Table.Status.VACANT)
+        self.first_table.refresh_from_db()
+        self.assertEqual(self.first_table.status, Table.Status.OCCUPIED)
+
+    def test_batch_is_applied_in_table_order(self):
+        with CaptureQueriesContext(connection) as queries:
+            results = self.sync(
+                self.offline_order(self.second_table, "b"),
+                self.offline_order(self.first_table, "a"),
+            )
+
+        # Results keep the submitted order ...
+        self.assertEqual([result["offline_id"] for result in results], ["b", "a"])
+        # ... while rows are written table by table, lowest pk first
+        first_order = Order.objects.get(table=self.first_table)
+        second_order = Order.objects.get(table=self.second_table)
+        self.assertLess(first_order.pk, second_order.pk)
+
+        # The batch's tables are locked up front by one query, in pk order
+        lock_query = next(
+            query["sql"] for query in queries.captured_queries
+            if query["sql"].startswith("SELECT")
+            and 'FROM "tables_table"' in query["sql"]
+        )
+        self.assertIn('ORDER BY "tables_table"."id" ASC', lock_query)
+
+
+class CachedPayloadTests(WaiterAPITestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.floor = Floor.objects.create(name="Main Floor")
+        Table.objects.create(floor=self.floor, number="T1", capacity=4)
+
+    def test_unchanged_payload_answers_304(self):
+        for name in ("waiter:api_menu", "waiter:api_tables"):
+            with self.subTest(view=name):
+                url = reverse(name)
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+
+                revalidated = self.client.get(
+                    url, HTTP_IF_NONE_MATCH=response["ETag"]
+                )
+                self.assertEqual(revalidated.status_code, 304)
+                self.assertEqual(revalidated["ETag"], response["ETag"])
+                self.assertEqual(revalidated.content, b"")
+
+                revalidated = self.client.get(
+                    url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+                )
+                self.assertEqual(revalidated.status_code, 304)
+
+    def test_changed_tables_get_new_etag(self):
+        url = reverse("waiter:api_tables")
+        etag = self.client.get(url)["ETag"]
+
+        Table.objects.create(floor=self.floor, number="T2", capacity=2)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
 
-# Create your tests here.
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        tables = [
+            table["number"]
+            for floor in orjson.loads(response.content)["floors"]
+            for table in floor["tables"]
+        ]
+        self.assertEqual(tables, ["T1", "T2"])
@@ -17,6 +17,7 @@ urlpatterns = [
     path("table/<int:pk>/", views.waiter_table_detail, name="table_detail"),
     path("table/<int:pk>/seat/<int:seat>/", views.waiter_take_order, name="take_order"),
     path("table/<int:pk>/seat/<int:seat>/add/", views.waiter_add_item, name="add_item"),
+    path("table/<int:pk>/seat/<int:seat>/add-bulk/", views.waiter_add_items_bulk, name="add_items_bulk"),
     path("table/<int:pk>/seat/<int:seat>/submit/", views.waiter_submit_order, name="submit_order"),
 
     # Orders
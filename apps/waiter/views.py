@@ -2,37 +2,127 @@
 Waiter PWA views for mobile ordering and table management.
 """
 
-import json
-from decimal import Decimal
-
+import hashlib
+import time
+from functools import wraps
+from itertools import groupby
+from operator import itemgetter
+
+import orjson
+from django.conf import settings
 from django.contrib import messages
-from django.contrib.auth.decorators import login_required
-from django.db.models import Count, Sum
-from django.http import JsonResponse
+from django.contrib.auth.views import redirect_to_login
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, F, FilteredRelation, Max, Prefetch, Q
+from django.http import HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
+from django.template.loader import render_to_string
 from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.dateparse import parse_datetime
+from django.utils.encoding import filepath_to_uri
+from django.utils.http import http_date
 from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.gzip import gzip_page
 from django.views.decorators.http import require_http_methods
 
-from apps.core.models import BusinessSettings
-from apps.menu.models import Category, MenuItem
+from apps.menu.models import (
+    MENU_ITEM_CACHE_KEY,
+    MENU_TREE_CACHE_KEY,
+    Category,
+    MenuItem,
+)
 from apps.orders.models import KitchenOrderTicket, Order, OrderItem
 from apps.tables.models import Floor, Table
 
+# Columns written by Order.calculate_totals()
+ORDER_TOTAL_FIELDS = [
+    "subtotal",
+    "discount_amount",
+    "cgst_amount",
+    "sgst_amount",
+    "service_charge",
+    "total_amount",
+    "updated_at",
+]
+
+# Free-text Order columns that adding items, totals and the kitchen
+# broadcast never read
+SEAT_ORDER_DEFERRED_FIELDS = (
+    "customer_email",
+    "customer_notes",
+    "internal_notes",
+    "discount_reason",
+)
+
+VALID_ORDER_STATUSES = frozenset(Order.Status.values)
+
+# Order status groups shared by the waiter queries
+ACTIVE_ORDER_STATUSES = (
+    Order.Status.PENDING,
+    Order.Status.CONFIRMED,
+    Order.Status.PREPARING,
+    Order.Status.READY,
+)
+IN_PROGRESS_ORDER_STATUSES = (
+    Order.Status.PENDING,
+    Order.Status.CONFIRMED,
+    Order.Status.PREPARING,
+)
+# An open seat order can still take new items
+OPEN_SEAT_ORDER_STATUSES = (
+    Order.Status.PENDING,
+    Order.Status.CONFIRMED,
+)
+
+# Roles allowed into the waiter app (superusers always are)
+WAITER_ALLOWED_ROLES = frozenset({"super_admin", "outlet_manager", "waiter"})
+
+# Orders per page in the waiter order list
+ORDERS_PAGE_SIZE = 50
+
+# Seconds the menu payload stays cached (menu signals also invalidate it)
+MENU_TREE_CACHE_TIMEOUT = 600
+
+# Seconds a versioned tables payload stays cached
+TABLES_PAYLOAD_CACHE_TIMEOUT = 3600
+
+# Seconds a menu item availability snapshot stays cached
+MENU_ITEM_CACHE_TIMEOUT = 60
+
+# Rendered offline fallback page, filled on first request
+_offline_body = None
+
+
+def _has_waiter_access(user):
+    """Superusers and the waiter-app roles may use the waiter views."""
+    return user.is_superuser or getattr(user, "role", None) in WAITER_ALLOWED_ROLES
+
 
 def waiter_required(view_func):
     """Decorator to check if user is a waiter or admin."""
-    from functools import wraps
     @wraps(view_func)
     def wrapper(request, *args, **kwargs):
-        if not request.user.is_authenticated:
-            from django.contrib.auth.views import redirect_to_login
+        user = request.user
+        if not user.is_authenticated:
             return redirect_to_login(request.get_full_path(), "dashboard:login")
-        # Allow super_admin, outlet_manager, and waiter roles
-        allowed_roles = ["super_admin", "outlet_manager", "waiter"]
-        if not (request.user.is_superuser or request.user.role in allowed_roles):
-            messages.error(request, "Access denied. Waiter access required.")
-            return redirect("dashboard:home")
+        if _has_waiter_access(user):
+            return view_func(request, *args, **kwargs)
+        messages.error(request, "Access denied. Waiter access required.")
+        return redirect("dashboard:home")
+    return wrapper
+
+
+def waiter_api_required(view_func):
+    """Like waiter_required, but answers with JSON errors for the PWA API."""
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        user = request.user
+        if not user.is_authenticated:
+            return JsonResponse({"error": "Authentication required"}, status=401)
+        if not _has_waiter_access(user):
+            return JsonResponse({"error": "Access denied"}, status=403)
         return view_func(request, *args, **kwargs)
     return wrapper
 
@@ -44,25 +134,33 @@ def waiter_home(request):
     """
     today = timezone.now().date()
 
-    # Get stats
-    active_orders = Order.objects.filter(
-        status__in=[Order.Status.PENDING, Order.Status.CONFIRMED, Order.Status.PREPARING]
-    ).count()
-
-    today_orders = Order.objects.filter(
-        created_at__date=today
-    ).count()
-
-    occupied_tables = Table.objects.filter(
-        status=Table.Status.OCCUPIED,
-        is_active=True
-    ).count()
+    # Get stats (both order counts in one round-trip)
+    order_stats = Order.objects.aggregate(
+        active=Count(
+            "id",
+            filter=Q(status__in=IN_PROGRESS_ORDER_STATUSES),
+        ),
+        today=Count("id", filter=Q(created_at__date=today)),
+    )
+    active_orders = order_stats["active"]
+    today_orders = order_stats["today"]
 
     # Get tables with active orders
-    tables_with_orders = Table.objects.filter(
+    occupied_qs = Table.objects.filter(
         status=Table.Status.OCCUPIED,
         is_active=True
-    ).select_related("floor").order_by("floor__display_order", "number")[:6]
+    )
+    tables_with_orders = list(
+        occupied_qs.select_related("floor")
+        .defer("qr_image")
+        .order_by("floor__display_order", "number")[:6]
+    )
+
+    # A short list is the full set; only count when it was cut off
+    if len(tables_with_orders) < 6:
+        occupied_tables = len(tables_with_orders)
+    else:
+        occupied_tables = occupied_qs.count()
 
     # Recent orders
     recent_orders = Order.objects.filter(
@@ -75,7 +173,6 @@ def waiter_home(request):
         "occupied_tables": occupied_tables,
         "tables_with_orders": tables_with_orders,
         "recent_orders": recent_orders,
-        "business": BusinessSettings.load(),
     }
     return render(request, "waiter/home.html", context)
 
@@ -85,13 +182,18 @@ def waiter_tables(request):
     """
     Floor map view showing all tables.
     """
+    # Active tables only, pre-sorted and trimmed to what the tiles render
     floors = Floor.objects.filter(is_active=True).prefetch_related(
-        "tables"
+        Prefetch(
+            "tables",
+            queryset=Table.objects.filter(is_active=True)
+            .only("id", "floor_id", "number", "status", "capacity", "is_active")
+            .order_by("number"),
+        )
     ).order_by("display_order")
 
     context = {
         "floors": floors,
-        "business": BusinessSettings.load(),
     }
     return render(request, "waiter/tables.html", context)
 
@@ -106,27 +208,25 @@ def waiter_table_detail(request, pk):
     # Get all active orders for this table
     active_orders = Order.objects.filter(
         table=table,
-        status__in=[Order.Status.PENDING, Order.Status.CONFIRMED, Order.Status.PREPARING, Order.Status.READY]
-    ).order_by("party_name")
+        status__in=ACTIVE_ORDER_STATUSES
+    ).order_by("seat_number")
+
+    # Build seat status map (first order per seat wins, as before)
+    orders_by_seat = {}
+    for order in active_orders:
+        orders_by_seat.setdefault(order.seat_number, order)
 
-    # Build seat status map
     seat_info = []
     for seat_num in range(1, table.capacity + 1):
-        seat_order = None
-        for order in active_orders:
-            if order.party_name == f"Seat {seat_num}":
-                seat_order = order
-                break
         seat_info.append({
             "number": seat_num,
-            "order": seat_order,
+            "order": orders_by_seat.get(seat_num),
         })
 
     context = {
         "table": table,
         "seat_info": seat_info,
         "active_orders": active_orders,
-        "business": BusinessSettings.load(),
     }
     return render(request, "waiter/table_detail.html", context)
 
@@ -142,105 +242,244 @@ def waiter_take_order(request, pk, seat):
         messages.error(request, "Invalid seat number.")
         return redirect("waiter:table_detail", pk=pk)
 
-    # Get or find existing order for this seat
+    # Get or find existing order for this seat (the page only shows its number)
     existing_order = Order.objects.filter(
         table=table,
-        party_name=f"Seat {seat}",
-        status__in=[Order.Status.PENDING, Order.Status.CONFIRMED]
-    ).first()
-
-    # Get menu categories and items
-    categories = Category.objects.filter(is_active=True).prefetch_related(
-        "items"
-    ).order_by("display_order")
+        seat_number=seat,
+        status__in=OPEN_SEAT_ORDER_STATUSES
+    ).only("id", "order_number").first()
 
+    # The menu itself is loaded client-side from api_menu (cached offline)
     context = {
         "table": table,
         "seat": seat,
         "current_order": existing_order,
-        "categories": categories,
-        "business": BusinessSettings.load(),
     }
     return render(request, "waiter/take_order.html", context)
 
 
-@waiter_required
-def waiter_add_item(request, pk, seat):
+def _menu_item_snapshot(pk):
     """
-    Add item to an order for a specific seat.
+    Return {"id", "name", "base_price", "is_available"} for a menu item,
+    cached briefly (menu signals drop it on edit). None if it does not exist.
     """
-    if request.method != "POST":
-        return redirect("waiter:take_order", pk=pk, seat=seat)
+    try:
+        pk = int(pk)
+    except (TypeError, ValueError):
+        return None
 
-    table = get_object_or_404(Table, pk=pk, is_active=True)
+    def build():
+        return MenuItem.objects.filter(pk=pk).values(
+            "id", "name", "base_price", "is_available"
+        ).first()
 
-    if seat < 1 or seat > table.capacity:
-        messages.error(request, "Invalid seat number.")
-        return redirect("waiter:table_detail", pk=pk)
+    return cache.get_or_set(
+        MENU_ITEM_CACHE_KEY.format(pk), build, MENU_ITEM_CACHE_TIMEOUT
+    )
 
-    # Get existing order for this seat or create new one
-    order = Order.objects.filter(
-        table=table,
-        party_name=f"Seat {seat}",
-        status__in=[Order.Status.PENDING, Order.Status.CONFIRMED]
-    ).first()
 
-    created = False
-    if not order:
-        order = Order.objects.create(
+def _get_or_create_seat_order(table, seat, user):
+    """
+    Return the open order for a seat, creating it (with its kitchen ticket)
+    and marking the table occupied when there is none. Call inside
+    transaction.atomic().
+    """
+    try:
+        order, created = Order.objects.get_or_create(
             table=table,
-            party_name=f"Seat {seat}",
-            order_type=Order.OrderType.DINE_IN,
-            order_source=Order.OrderSource.WAITER,
-            status=Order.Status.PENDING,
-            created_by=request.user,
+            seat_number=seat,
+            status__in=OPEN_SEAT_ORDER_STATUSES,
+            defaults={
+                "party_name": f"Seat {seat}",
+                "order_type": Order.OrderType.DINE_IN,
+                "order_source": Order.OrderSource.POS,
+                "status": Order.Status.PENDING,
+                "created_by": user,
+            },
         )
-        created = True
+    except Order.MultipleObjectsReturned:
+        # Legacy duplicates for this seat: keep using the first one
+        order = Order.objects.filter(
+            table=table,
+            seat_number=seat,
+            status__in=OPEN_SEAT_ORDER_STATUSES
+        ).first()
+        created = False
 
     if created:
         # Create kitchen ticket
         KitchenOrderTicket.objects.create(order=order)
         # Update table status
-        table.status = Table.Status.OCCUPIED
-        table.save(update_fields=["status", "updated_at"])
+        table.set_status(Table.Status.OCCUPIED)
 
-    # Add item
-    menu_item_id = request.POST.get("menu_item")
-    quantity = int(request.POST.get("quantity", 1))
-    special_instructions = request.POST.get("special_instructions", "")
+    return order, created
 
-    try:
-        menu_item = MenuItem.objects.get(pk=menu_item_id, is_available=True)
-
-        # Check if item already exists
-        existing_item = order.items.filter(menu_item=menu_item).first()
-        if existing_item:
-            existing_item.quantity += quantity
-            existing_item.total_price = existing_item.unit_price * existing_item.quantity
-            existing_item.save()
-        else:
-            OrderItem.objects.create(
+
+def _load_available_menu_items(item_specs):
+    """Fetch every available menu item referenced by the specs in one query."""
+    menu_item_ids = []
+    for spec in item_specs:
+        try:
+            menu_item_ids.append(int(spec.get("menu_item_id")))
+        except (TypeError, ValueError):
+            continue
+    return MenuItem.objects.filter(is_available=True).in_bulk(menu_item_ids)
+
+
+def _add_items_to_order(order, item_specs, seat, menu_items=None):
+    """
+    Add a batch of {"menu_item_id", "quantity", "special_instructions"}
+    specs to an order with one menu lookup, one bulk insert and one bulk
+    update. Unknown or unavailable items are skipped. Pass menu_items
+    (from _load_available_menu_items) to share one lookup across orders.
+    Returns the number of specs applied.
+    """
+    if menu_items is None:
+        menu_items = _load_available_menu_items(item_specs)
+
+    lines = {item.menu_item_id: item for item in order.items.all()}
+    to_create = []
+    to_update = {}
+    now = timezone.now()
+    items_added = 0
+
+    for spec in item_specs:
+        try:
+            menu_item = menu_items.get(int(spec.get("menu_item_id")))
+            quantity = int(spec.get("quantity", 1))
+        except (TypeError, ValueError):
+            continue
+        if menu_item is None or quantity < 1:
+            continue
+
+        line = lines.get(menu_item.pk)
+        if line is None:
+            line = OrderItem(
                 order=order,
                 menu_item=menu_item,
                 item_name=menu_item.name,
                 unit_price=menu_item.base_price,
                 quantity=quantity,
                 total_price=menu_item.base_price * quantity,
+                special_instructions=spec.get("special_instructions", ""),
+                seat_number=seat,
+            )
+            lines[menu_item.pk] = line
+            to_create.append(line)
+        else:
+            line.quantity += quantity
+            line.total_price = line.unit_price * line.quantity + line.addons_total
+            if line.pk:
+                line.updated_at = now
+                to_update[line.pk] = line
+        items_added += 1
+
+    if to_create:
+        OrderItem.objects.bulk_create(to_create, batch_size=500)
+    if to_update:
+        OrderItem.objects.bulk_update(
+            to_update.values(), ["quantity", "total_price", "updated_at"]
+        )
+
+    return items_added
+
+
+@waiter_required
+def waiter_add_item(request, pk, seat):
+    """
+    Add item to an order for a specific seat.
+    """
+    if request.method != "POST":
+        return redirect("waiter:take_order", pk=pk, seat=seat)
+
+    table = get_object_or_404(Table, pk=pk, is_active=True)
+
+    if seat < 1 or seat > table.capacity:
+        messages.error(request, "Invalid seat number.")
+        return redirect("waiter:table_detail", pk=pk)
+
+    menu_item_id = request.POST.get("menu_item")
+    quantity = int(request.POST.get("quantity", 1))
+    special_instructions = request.POST.get("special_instructions", "")
+
+    menu_item = _menu_item_snapshot(menu_item_id)
+    if menu_item is None or not menu_item["is_available"]:
+        messages.error(request, "Item not available.")
+        return redirect("waiter:take_order", pk=pk, seat=seat)
+
+    # Order, kitchen ticket, table status, item and totals commit together
+    with transaction.atomic():
+        order, created = _get_or_create_seat_order(table, seat, request.user)
+
+        # Bump an existing line in a single atomic UPDATE, else add a new one
+        updated = order.items.filter(menu_item_id=menu_item["id"]).update(
+            quantity=F("quantity") + quantity,
+            total_price=F("unit_price") * (F("quantity") + quantity) + F("addons_total"),
+            updated_at=timezone.now(),
+        )
+        if not updated:
+            OrderItem.objects.create(
+                order=order,
+                menu_item_id=menu_item["id"],
+                item_name=menu_item["name"],
+                unit_price=menu_item["base_price"],
+                quantity=quantity,
+                total_price=menu_item["base_price"] * quantity,
                 special_instructions=special_instructions,
                 seat_number=seat,
             )
 
         # Recalculate totals
         order.calculate_totals()
-        order.save()
-
-        messages.success(request, f"Added {quantity}x {menu_item.name}")
-    except MenuItem.DoesNotExist:
-        messages.error(request, "Item not available.")
+        order.save(update_fields=ORDER_TOTAL_FIELDS)
 
+    messages.success(request, f"Added {quantity}x {menu_item['name']}")
     return redirect("waiter:take_order", pk=pk, seat=seat)
 
 
+@waiter_required
+def waiter_add_items_bulk(request, pk, seat):
+    """
+    Add a batch of items to a seat's order in one request.
+    Used by the PWA to replay queued item adds after reconnecting;
+    POST "items" is a JSON list of {menu_item_id, quantity, special_instructions}.
+    """
+    if request.method != "POST":
+        return JsonResponse({"error": "POST required"}, status=405)
+
+    table = get_object_or_404(Table, pk=pk, is_active=True)
+
+    if seat < 1 or seat > table.capacity:
+        return JsonResponse({"error": "Invalid seat number"}, status=400)
+
+    try:
+        items = orjson.loads(request.POST.get("items", "[]"))
+    except orjson.JSONDecodeError:
+        return JsonResponse({"error": "Invalid JSON"}, status=400)
+
+    if not isinstance(items, list) or not items:
+        return JsonResponse({"error": "No items"}, status=400)
+
+    with transaction.atomic():
+        order, created = _get_or_create_seat_order(table, seat, request.user)
+        items_added = _add_items_to_order(order, items, seat)
+
+        # Recalculate totals once for the whole batch; nothing to do when
+        # every spec was skipped
+        if items_added:
+            order.calculate_totals()
+            order.save(update_fields=ORDER_TOTAL_FIELDS)
+
+    return JsonResponse({
+        "success": True,
+        "order_id": order.pk,
+        "order_number": order.order_number,
+        "items_added": items_added,
+        "created": created,
+        "total": str(order.total_amount),
+    })
+
+
 @waiter_required
 def waiter_submit_order(request, pk, seat):
     """
@@ -252,17 +491,19 @@ def waiter_submit_order(request, pk, seat):
     table = get_object_or_404(Table, pk=pk, is_active=True)
 
     try:
-        order = Order.objects.get(
-            table=table,
-            party_name=f"Seat {seat}",
-            status=Order.Status.PENDING
-        )
+        # Lock the row so the item check and the status change see one state
+        with transaction.atomic():
+            order = Order.objects.select_for_update().get(
+                table=table,
+                seat_number=seat,
+                status=Order.Status.PENDING
+            )
 
-        if not order.items.exists():
-            messages.error(request, "No items in order.")
-            return redirect("waiter:take_order", pk=pk, seat=seat)
+            if not order.items.exists():
+                messages.error(request, "No items in order.")
+                return redirect("waiter:take_order", pk=pk, seat=seat)
 
-        order.update_status(Order.Status.CONFIRMED)
+            order.update_status(Order.Status.CONFIRMED)
         messages.success(request, f"Order for Seat {seat} sent to kitchen!")
 
     except Order.DoesNotExist:
@@ -280,19 +521,36 @@ def waiter_orders(request):
 
     if status_filter == "active":
         orders = Order.objects.filter(
-            status__in=[Order.Status.PENDING, Order.Status.CONFIRMED, Order.Status.PREPARING, Order.Status.READY]
+            status__in=ACTIVE_ORDER_STATUSES
         )
     elif status_filter == "completed":
         orders = Order.objects.filter(status=Order.Status.COMPLETED)
     else:
         orders = Order.objects.all()
 
-    orders = orders.select_related("table").order_by("-created_at")[:50]
+    # Keyset pagination: ?before=<created_at of the last order shown>
+    try:
+        before = parse_datetime(request.GET.get("before", ""))
+    except ValueError:
+        before = None
+    if before:
+        orders = orders.filter(created_at__lt=before)
+
+    # Item count is annotated so the list does not run one COUNT per order
+    orders = list(
+        orders.select_related("table").annotate(
+            items_count=Count("items")
+        ).order_by("-created_at")[:ORDERS_PAGE_SIZE]
+    )
+
+    next_before = None
+    if len(orders) == ORDERS_PAGE_SIZE:
+        next_before = orders[-1].created_at.isoformat()
 
     context = {
         "orders": orders,
         "status_filter": status_filter,
-        "business": BusinessSettings.load(),
+        "next_before": next_before,
     }
     return render(request, "waiter/orders.html", context)
 
@@ -309,7 +567,6 @@ def waiter_order_detail(request, pk):
 
     context = {
         "order": order,
-        "business": BusinessSettings.load(),
     }
     return render(request, "waiter/order_detail.html", context)
 
@@ -325,9 +582,9 @@ def waiter_update_order_status(request, pk):
     order = get_object_or_404(Order, pk=pk)
     new_status = request.POST.get("status")
 
-    valid_statuses = [s[0] for s in Order.Status.choices]
-    if new_status in valid_statuses:
-        order.update_status(new_status)
+    if new_status in VALID_ORDER_STATUSES:
+        with transaction.atomic():
+            order.update_status(new_status)
         messages.success(request, f"Order status updated to {order.get_status_display()}")
     else:
         messages.error(request, "Invalid status.")
@@ -339,9 +596,16 @@ def offline_page(request):
     """
     Offline fallback page for PWA.
     """
-    return render(request, "waiter/offline.html", {
-        "business": BusinessSettings.load(),
-    })
+    global _offline_body
+
+    # The page is static, so render it once without the request context
+    # processors and serve the same body afterwards
+    if _offline_body is None:
+        _offline_body = render_to_string("waiter/offline.html")
+
+    response = HttpResponse(_offline_body)
+    response["Cache-Control"] = "public, max-age=3600"
+    return response
 
 
 # =============================================================================
@@ -349,190 +613,295 @@ def offline_page(request):
 # =============================================================================
 
 
-@waiter_required
-def api_menu(request):
+def _build_menu_tree():
     """
-    Get all menu items organized by category for offline caching.
+    Build the category -> available items tree as plain, cacheable data
+    from one LEFT JOIN (categories with no available items keep an empty
+    list).
+    """
+    rows = Category.objects.filter(is_active=True).annotate(
+        item=FilteredRelation("items", condition=Q(items__is_available=True))
+    ).order_by("display_order", "id", "item__display_order").values_list(
+        "id",
+        "name",
+        "display_order",
+        "item__id",
+        "item__name",
+        "item__description",
+        "item__base_price",
+        "item__image",
+        "item__food_type",
+    )
+
+    # Media is served by FileSystemStorage, so image URLs are
+    # MEDIA_URL + file path
+    media_url = settings.MEDIA_URL
+    non_veg = MenuItem.FoodType.NON_VEG
+    tree = []
+    for category, group in groupby(rows, key=itemgetter(0, 1, 2)):
+        category_id, name, display_order = category
+        items = []
+        for row in group:
+            item_id, item_name, description, base_price, image, food_type = row[3:]
+            if item_id is None:
+                continue
+            items.append({
+                "id": item_id,
+                "name": item_name,
+                "description": description or "",
+                "base_price": format(base_price, "f"),
+                "image_url": media_url + filepath_to_uri(image) if image else None,
+                "is_veg": food_type != non_veg,
+            })
+        tree.append({
+            "id": category_id,
+            "name": name,
+            "display_order": display_order,
+            "items": items,
+        })
+    return tree
+
+
+def _build_tables_payload():
     """
-    categories = Category.objects.filter(is_active=True).order_by("display_order")
+    Build the floor -> active tables payload as plain, cacheable data
+    from one LEFT JOIN (floors with no active tables keep an empty list).
+    """
+    rows = Floor.objects.filter(is_active=True).annotate(
+        active_table=FilteredRelation("tables", condition=Q(tables__is_active=True))
+    ).order_by("display_order", "id", "active_table__number").values_list(
+        "id",
+        "name",
+        "active_table__id",
+        "active_table__number",
+        "active_table__name",
+        "active_table__capacity",
+        "active_table__status",
+    )
 
     data = {
-        "categories": [],
+        "floors": [],
         "timestamp": timezone.now().isoformat(),
     }
 
-    for category in categories:
-        cat_data = {
-            "id": category.pk,
-            "name": category.name,
-            "display_order": category.display_order,
-            "items": []
-        }
+    for (floor_id, name), group in groupby(rows, key=itemgetter(0, 1)):
+        tables = []
+        for row in group:
+            table_id, number, table_name, capacity, table_status = row[2:]
+            if table_id is None:
+                continue
+            tables.append({
+                "id": table_id,
+                "number": number,
+                "name": table_name,
+                "capacity": capacity,
+                "status": table_status,
+            })
+        data["floors"].append({"id": floor_id, "name": name, "tables": tables})
 
-        items = MenuItem.objects.filter(
-            category=category,
-            is_available=True,
-            is_active=True
-        ).order_by("display_order")
-
-        for item in items:
-            item_data = {
-                "id": item.pk,
-                "name": item.name,
-                "description": item.description or "",
-                "base_price": str(item.base_price),
-                "image_url": item.image.url if item.image else None,
-                "is_veg": getattr(item, "is_veg", True),
-            }
-            cat_data["items"].append(item_data)
+    return data
+
+
+def _tables_payload_cache_key():
+    """
+    Version the tables payload on the newest table and floor edits and their
+    counts, so status changes (which skip signals) still miss the cache.
+    Floors are aggregated on their own so floors without tables count too.
+    """
+    tables = Table.objects.aggregate(count=Count("id"), updated=Max("updated_at"))
+    floors = Floor.objects.aggregate(count=Count("id"), updated=Max("updated_at"))
+    parts = []
+    for version in (tables, floors):
+        stamp = version["updated"]
+        parts.append(version["count"])
+        parts.append(f"{stamp.timestamp():.6f}" if stamp else "0")
+    return "waiter_tables_v4:{}:{}:{}:{}".format(*parts)
 
-        data["categories"].append(cat_data)
 
-    return JsonResponse(data)
+def _json_response(data):
+    """JSON response encoded with orjson (Decimals are written as strings)."""
+    return HttpResponse(orjson.dumps(data, default=str), content_type="application/json")
 
 
+def _cached_json_response(request, cache_key, build, timeout):
+    """
+    Serve a JSON body from the cache, encoding it only on a miss.
+    The body's ETag and build time are cached with it, so unchanged
+    payloads answer 304 to If-None-Match or If-Modified-Since.
+    """
+    cached = cache.get(cache_key)
+    if cached is None:
+        body = orjson.dumps(build(), default=str)
+        cached = (
+            f'"{hashlib.md5(body, usedforsecurity=False).hexdigest()}"',
+            int(time.time()),
+            body,
+        )
+        cache.set(cache_key, cached, timeout)
+
+    etag, last_modified, body = cached
+    response = HttpResponse(body, content_type="application/json")
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    # Private, but storable so the browser revalidates on every poll
+    response["Cache-Control"] = "private, no-cache"
+    return get_conditional_response(
+        request, etag=etag, last_modified=last_modified, response=response
+    )
+
+
+@gzip_page
+@waiter_required
+def api_menu(request):
+    """
+    Get all menu items organized by category for offline caching.
+    """
+    def build():
+        return {
+            "categories": _build_menu_tree(),
+            "timestamp": timezone.now().isoformat(),
+        }
+
+    return _cached_json_response(
+        request, MENU_TREE_CACHE_KEY, build, MENU_TREE_CACHE_TIMEOUT
+    )
+
+
+@gzip_page
 @waiter_required
 def api_tables(request):
     """
     Get all tables organized by floor for offline caching.
     """
-    floors = Floor.objects.filter(is_active=True).order_by("display_order")
+    return _cached_json_response(
+        request,
+        _tables_payload_cache_key(), _build_tables_payload, TABLES_PAYLOAD_CACHE_TIMEOUT
+    )
 
-    data = {
-        "floors": [],
-        "timestamp": timezone.now().isoformat(),
-    }
 
-    for floor in floors:
-        floor_data = {
-            "id": floor.pk,
-            "name": floor.name,
-            "tables": []
-        }
+def _parse_offline_order(data):
+    """
+    Validate one queued offline order before any database work.
+    Returns int table_id/seat, item specs with int ids and quantities,
+    offline_id and auto_confirm. Malformed items are dropped, like unknown
+    ones. Raises ValueError with the client-facing message.
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Invalid order")
 
-        tables = Table.objects.filter(
-            floor=floor,
-            is_active=True
-        ).order_by("number")
-
-        for table in tables:
-            table_data = {
-                "id": table.pk,
-                "number": table.number,
-                "name": table.name,
-                "capacity": table.capacity,
-                "status": table.status,
-            }
-            floor_data["tables"].append(table_data)
+    table_id = data.get("table_id")
+    seat = data.get("seat")
+    items = data.get("items")
+
+    if not table_id or not seat or not items:
+        raise ValueError("Missing required fields")
+    if not isinstance(items, list):
+        raise ValueError("Invalid items")
+
+    try:
+        table_id = int(table_id)
+        seat = int(seat)
+    except (TypeError, ValueError):
+        raise ValueError("Invalid table or seat") from None
 
-        data["floors"].append(floor_data)
+    item_specs = []
+    for item in items:
+        try:
+            item_specs.append({
+                "menu_item_id": int(item["menu_item_id"]),
+                "quantity": int(item.get("quantity", 1)),
+                "special_instructions": str(item.get("special_instructions", "")),
+            })
+        except (AttributeError, KeyError, TypeError, ValueError):
+            continue
 
-    return JsonResponse(data)
+    return {
+        "table_id": table_id,
+        "seat": seat,
+        "items": item_specs,
+        "offline_id": data.get("offline_id"),
+        "auto_confirm": bool(data.get("auto_confirm", False)),
+    }
 
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@waiter_api_required
 def api_create_order(request):
     """
     Create an order from offline queue.
     Accepts order data as JSON and creates the order with items.
     """
-    # Check authentication
-    if not request.user.is_authenticated:
-        return JsonResponse({"error": "Authentication required"}, status=401)
-
-    if not (request.user.is_superuser or request.user.role in ["admin", "waiter"]):
-        return JsonResponse({"error": "Access denied"}, status=403)
-
     try:
-        data = json.loads(request.body)
-    except json.JSONDecodeError:
+        data = orjson.loads(request.body)
+    except orjson.JSONDecodeError:
         return JsonResponse({"error": "Invalid JSON"}, status=400)
 
-    # Required fields
-    table_id = data.get("table_id")
-    seat = data.get("seat")
-    items = data.get("items", [])
-    offline_id = data.get("offline_id")  # Client-side ID for tracking
-
-    if not table_id or not seat or not items:
-        return JsonResponse({"error": "Missing required fields"}, status=400)
-
     try:
-        table = Table.objects.get(pk=table_id, is_active=True)
-    except Table.DoesNotExist:
-        return JsonResponse({"error": "Table not found"}, status=404)
-
-    if seat < 1 or seat > table.capacity:
-        return JsonResponse({"error": "Invalid seat number"}, status=400)
+        order_data = _parse_offline_order(data)
+    except ValueError as e:
+        return JsonResponse({"error": str(e)}, status=400)
 
-    # Check for existing pending order for this seat
-    existing_order = Order.objects.filter(
-        table=table,
-        party_name=f"Seat {seat}",
-        status__in=[Order.Status.PENDING, Order.Status.CONFIRMED]
-    ).first()
+    table_id = order_data["table_id"]
+    seat = order_data["seat"]
+    items = order_data["items"]
+    offline_id = order_data["offline_id"]  # Client-side ID for tracking
 
-    if existing_order:
-        order = existing_order
-        created = False
-    else:
-        order = Order.objects.create(
+    # Order, ticket, table status, lines and totals commit together
+    with transaction.atomic():
+        try:
+            # Lock the table row so concurrent submits for it serialize
+            table = Table.objects.select_for_update(of=("self",)).select_related(
+                "floor__outlet"
+            ).get(pk=table_id, is_active=True)
+        except Table.DoesNotExist:
+            return JsonResponse({"error": "Table not found"}, status=404)
+
+        if seat < 1 or seat > table.capacity:
+            return JsonResponse({"error": "Invalid seat number"}, status=400)
+
+        # Check for existing pending order for this seat
+        existing_order = Order.objects.filter(
             table=table,
-            outlet=table.floor.outlet if table.floor else None,
-            party_name=f"Seat {seat}",
-            order_type=Order.OrderType.DINE_IN,
-            order_source=Order.OrderSource.POS,
-            status=Order.Status.PENDING,
-            created_by=request.user,
-        )
-        created = True
-        # Create kitchen ticket
-        KitchenOrderTicket.objects.create(order=order)
-        # Update table status
-        table.status = Table.Status.OCCUPIED
-        table.save(update_fields=["status", "updated_at"])
+            seat_number=seat,
+            status__in=OPEN_SEAT_ORDER_STATUSES
+        ).defer(*SEAT_ORDER_DEFERRED_FIELDS).first()
 
-    # Add items
-    items_added = 0
-    for item_data in items:
-        menu_item_id = item_data.get("menu_item_id")
-        quantity = item_data.get("quantity", 1)
-        special_instructions = item_data.get("special_instructions", "")
+        if existing_order:
+            order = existing_order
+            created = False
+        else:
+            order = Order.objects.create(
+                table=table,
+                outlet=table.floor.outlet if table.floor else None,
+                party_name=f"Seat {seat}",
+                seat_number=seat,
+                order_type=Order.OrderType.DINE_IN,
+                order_source=Order.OrderSource.POS,
+                status=Order.Status.PENDING,
+                created_by=request.user,
+            )
+            created = True
+            # Create kitchen ticket
+            KitchenOrderTicket.objects.create(order=order)
+            # Update table status
+            table.status = Table.Status.OCCUPIED
+            table.save(update_fields=["status", "updated_at"])
+
+        # Add items (one menu lookup, bulk insert/update of the lines)
+        items_added = _add_items_to_order(order, items, seat)
+
+        # Recalculate totals once, after all lines are written; nothing to
+        # do when every item was skipped
+        if items_added:
+            order.calculate_totals()
+            order.save(update_fields=ORDER_TOTAL_FIELDS)
 
-        try:
-            menu_item = MenuItem.objects.get(pk=menu_item_id, is_available=True)
-
-            # Check if item already exists
-            existing_item = order.items.filter(menu_item=menu_item).first()
-            if existing_item:
-                existing_item.quantity += quantity
-                existing_item.total_price = existing_item.unit_price * existing_item.quantity
-                existing_item.save()
-            else:
-                OrderItem.objects.create(
-                    order=order,
-                    menu_item=menu_item,
-                    item_name=menu_item.name,
-                    unit_price=menu_item.base_price,
-                    quantity=quantity,
-                    total_price=menu_item.base_price * quantity,
-                    special_instructions=special_instructions,
-                    seat_number=seat,
-                )
-            items_added += 1
-        except MenuItem.DoesNotExist:
-            continue  # Skip invalid items
-
-    # Recalculate totals
-    order.calculate_totals()
-    order.save()
-
-    # Auto-confirm if requested
-    if data.get("auto_confirm", False) and order.status == Order.Status.PENDING:
-        order.update_status(Order.Status.CONFIRMED)
+        # Auto-confirm if requested
+        if order_data["auto_confirm"] and order.status == Order.Status.PENDING:
+            order.update_status(Order.Status.CONFIRMED)
 
-    return JsonResponse({
+    return _json_response({
         "success": True,
         "order_id": order.pk,
         "order_number": order.order_number,
@@ -545,120 +914,151 @@ def api_create_order(request):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@waiter_api_required
 def api_sync_orders(request):
     """
     Sync multiple offline orders at once.
     Returns results for each order.
     """
-    if not request.user.is_authenticated:
-        return JsonResponse({"error": "Authentication required"}, status=401)
-
-    if not (request.user.is_superuser or request.user.role in ["admin", "waiter"]):
-        return JsonResponse({"error": "Access denied"}, status=403)
-
     try:
-        data = json.loads(request.body)
-    except json.JSONDecodeError:
+        data = orjson.loads(request.body)
+    except orjson.JSONDecodeError:
         return JsonResponse({"error": "Invalid JSON"}, status=400)
 
-    orders = data.get("orders", [])
-    results = []
+    orders = data.get("orders", []) if isinstance(data, dict) else None
+    if not isinstance(orders, list):
+        return JsonResponse({"error": "orders must be a list"}, status=400)
+
+    results = [None] * len(orders)
+    occupied_tables = set()  # pks of tables that got a new order
+    new_orders = []
+    orders_to_confirm = []
 
-    for order_data in orders:
+    # Validate every order up front; malformed ones fail without DB work
+    parsed_orders = []
+    for index, raw_order in enumerate(orders):
         try:
-            # Process each order using the same logic as api_create_order
-            table_id = order_data.get("table_id")
-            seat = order_data.get("seat")
-            items = order_data.get("items", [])
-            offline_id = order_data.get("offline_id")
-
-            if not table_id or not seat or not items:
-                results.append({
-                    "offline_id": offline_id,
-                    "success": False,
-                    "error": "Missing required fields"
-                })
-                continue
+            parsed_orders.append((index, _parse_offline_order(raw_order)))
+        except ValueError as e:
+            results[index] = {
+                "offline_id": raw_order.get("offline_id") if isinstance(raw_order, dict) else None,
+                "success": False,
+                "error": str(e),
+            }
 
-            try:
-                table = Table.objects.get(pk=table_id, is_active=True)
-            except Table.DoesNotExist:
-                results.append({
-                    "offline_id": offline_id,
-                    "success": False,
-                    "error": "Table not found"
-                })
-                continue
+    # One menu lookup for every item across the whole batch
+    menu_items = _load_available_menu_items(
+        [item for _, order_data in parsed_orders for item in order_data["items"]]
+    )
 
-            # Check for existing order
-            existing_order = Order.objects.filter(
-                table=table,
-                party_name=f"Seat {seat}",
-                status__in=[Order.Status.PENDING, Order.Status.CONFIRMED]
-            ).first()
-
-            if existing_order:
-                order = existing_order
-            else:
-                order = Order.objects.create(
-                    table=table,
-                    outlet=table.floor.outlet if table.floor else None,
-                    party_name=f"Seat {seat}",
-                    order_type=Order.OrderType.DINE_IN,
-                    order_source=Order.OrderSource.POS,
-                    status=Order.Status.PENDING,
-                    created_by=request.user,
-                )
-                KitchenOrderTicket.objects.create(order=order)
-                table.status = Table.Status.OCCUPIED
-                table.save(update_fields=["status", "updated_at"])
-
-            # Add items
-            for item_data in items:
-                menu_item_id = item_data.get("menu_item_id")
-                quantity = item_data.get("quantity", 1)
-
-                try:
-                    menu_item = MenuItem.objects.get(pk=menu_item_id, is_available=True)
-                    existing_item = order.items.filter(menu_item=menu_item).first()
-                    if existing_item:
-                        existing_item.quantity += quantity
-                        existing_item.total_price = existing_item.unit_price * existing_item.quantity
-                        existing_item.save()
+    # One transaction for the whole batch
+    with transaction.atomic():
+        # Lock every table in the batch with one query, in pk order so
+        # concurrent syncs cannot deadlock on each other's rows
+        tables = {
+            table.pk: table
+            for table in Table.objects.select_for_update(of=("self",))
+            .select_related("floor__outlet")
+            .filter(
+                pk__in={order_data["table_id"] for _, order_data in parsed_orders},
+                is_active=True,
+            )
+            .order_by("pk")
+        }
+
+        # Walk the batch in table order so each table's orders are applied
+        # together; results keep the submitted order
+        for index, order_data in sorted(
+            parsed_orders, key=lambda pair: pair[1]["table_id"]
+        ):
+            try:
+                # Process each order using the same logic as api_create_order
+                table_id = order_data["table_id"]
+                seat = order_data["seat"]
+                items = order_data["items"]
+                offline_id = order_data["offline_id"]
+
+                # Savepoint per order: a failure rolls back only that order
+                with transaction.atomic():
+                    table = tables.get(table_id)
+                    if table is None:
+                        results[index] = {
+                            "offline_id": offline_id,
+                            "success": False,
+                            "error": "Table not found"
+                        }
+                        continue
+
+                    # Check for existing order
+                    existing_order = Order.objects.filter(
+                        table=table,
+                        seat_number=seat,
+                        status__in=OPEN_SEAT_ORDER_STATUSES
+                    ).defer(*SEAT_ORDER_DEFERRED_FIELDS).first()
+
+                    created = existing_order is None
+                    if existing_order:
+                        order = existing_order
                     else:
-                        OrderItem.objects.create(
-                            order=order,
-                            menu_item=menu_item,
-                            item_name=menu_item.name,
-                            unit_price=menu_item.base_price,
-                            quantity=quantity,
-                            total_price=menu_item.base_price * quantity,
+                        order = Order.objects.create(
+                            table=table,
+                            outlet=table.floor.outlet if table.floor else None,
+                            party_name=f"Seat {seat}",
                             seat_number=seat,
+                            order_type=Order.OrderType.DINE_IN,
+                            order_source=Order.OrderSource.POS,
+                            status=Order.Status.PENDING,
+                            created_by=request.user,
                         )
-                except MenuItem.DoesNotExist:
-                    continue
-
-            order.calculate_totals()
-            order.save()
-
-            if order_data.get("auto_confirm", False):
-                order.update_status(Order.Status.CONFIRMED)
 
-            results.append({
-                "offline_id": offline_id,
-                "success": True,
-                "order_id": order.pk,
-                "order_number": order.order_number,
-            })
-
-        except Exception as e:
-            results.append({
-                "offline_id": order_data.get("offline_id"),
-                "success": False,
-                "error": str(e)
-            })
+                    # Add items (one menu lookup, bulk insert/update of the lines)
+                    items_added = _add_items_to_order(order, items, seat, menu_items)
+
+                    # Recalculate totals once, after all lines are written;
+                    # nothing to do when every item was skipped
+                    if items_added:
+                        order.calculate_totals()
+                        order.save(update_fields=ORDER_TOTAL_FIELDS)
+
+                    results[index] = {
+                        "offline_id": offline_id,
+                        "success": True,
+                        "order_id": order.pk,
+                        "order_number": order.order_number,
+                    }
+
+                # Only orders that went through get a ticket, a table flip
+                # and their confirmation
+                if created:
+                    new_orders.append(order)
+                    occupied_tables.add(table.pk)
+                if order_data["auto_confirm"]:
+                    orders_to_confirm.append(order)
+
+            except Exception as e:
+                results[index] = {
+                    "offline_id": order_data["offline_id"],
+                    "success": False,
+                    "error": str(e)
+                }
+
+        # Kitchen tickets for all new orders in one INSERT; confirmations run
+        # afterwards so their kitchen broadcast carries the ticket
+        if new_orders:
+            KitchenOrderTicket.bulk_create_for_orders(new_orders)
+        for order in orders_to_confirm:
+            order.update_status(Order.Status.CONFIRMED)
+
+        # Mark every table that got a new order occupied in one UPDATE
+        if occupied_tables:
+            Table.bulk_set_status(
+                Table.objects.filter(pk__in=occupied_tables).exclude(
+                    status=Table.Status.OCCUPIED
+                ),
+                Table.Status.OCCUPIED,
+            )
 
-    return JsonResponse({
+    return _json_response({
         "success": True,
         "results": results,
         "synced": sum(1 for r in results if r.get("success")),
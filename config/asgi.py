@@ -13,6 +13,7 @@ from channels.auth import AuthMiddlewareStack
 from channels.routing import ProtocolTypeRouter, URLRouter
 from channels.security.websocket import AllowedHostsOriginValidator
 from django.core.asgi import get_asgi_application
+from django.urls import get_resolver
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.production")
 
@@ -20,6 +21,10 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.production")
 # is populated before importing code that may import ORM models.
 django_asgi_app = get_asgi_application()
 
+# Import the URLconf (and every included app's urls and views) and build the
+# reverse lookup tables at worker start instead of on its first request
+get_resolver().reverse_dict
+
 # Import websocket routing after Django setup
 from realtime.routing import websocket_urlpatterns  # noqa: E402
 
@@ -215,9 +215,11 @@ REDIS_URL = config("REDIS_URL", default="redis://localhost:6379/0")
 # CHANNELS (WebSocket)
 # =============================================================================
 
+# Native Redis pub/sub: the consumers only use groups (group_add /
+# group_send), which fan out without the list polling of RedisChannelLayer
 CHANNEL_LAYERS = {
     "default": {
-        "BACKEND": "channels_redis.core.RedisChannelLayer",
+        "BACKEND": "channels_redis.pubsub.RedisPubSubChannelLayer",
         "CONFIG": {
             "hosts": [REDIS_URL],
         },
@@ -4,8 +4,13 @@ Django development settings for Coffee Shop Management System.
 These settings extend base.py for local development.
 """
 
+import sys
+
 from .base import *  # noqa: F401, F403
 
+# The debug toolbar refuses to run under the test runner (DEBUG is forced off)
+TESTING = len(sys.argv) > 1 and sys.argv[1] == "test"
+
 # =============================================================================
 # DEBUG
 # =============================================================================
@@ -24,17 +29,18 @@ ALLOWED_HOSTS = ["localhost", "127.0.0.1", "0.0.0.0"]
 # INSTALLED APPS - Development extras
 # =============================================================================
 
-INSTALLED_APPS += [  # noqa: F405
-    "django_extensions",
-    "debug_toolbar",
-]
+INSTALLED_APPS += ["django_extensions"]  # noqa: F405
+
+if not TESTING:
+    INSTALLED_APPS += ["debug_toolbar"]  # noqa: F405
 
 
 # =============================================================================
 # MIDDLEWARE - Development extras
 # =============================================================================
 
-MIDDLEWARE.insert(0, "debug_toolbar.middleware.DebugToolbarMiddleware")  # noqa: F405
+if not TESTING:
+    MIDDLEWARE.insert(0, "debug_toolbar.middleware.DebugToolbarMiddleware")  # noqa: F405
 
 
 # =============================================================================
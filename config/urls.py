@@ -13,8 +13,14 @@ from drf_spectacular.views import (
     SpectacularSwaggerView,
 )
 
+
+def admin_login(request, extra_context=None):
+    """Send admin logins to the dashboard login page."""
+    return redirect("dashboard:login")
+
+
 # Override Django admin login to use our custom login
-admin.site.login = lambda request, extra_context=None: redirect('dashboard:login')
+admin.site.login = admin_login
 
 urlpatterns = [
     # Admin (uses our custom login)
@@ -62,10 +68,8 @@ if settings.DEBUG:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
     urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
 
-    # Debug toolbar
-    try:
-        import debug_toolbar
+# Debug toolbar (only installed by the development settings)
+if settings.DEBUG and "debug_toolbar" in settings.INSTALLED_APPS:
+    import debug_toolbar
 
-        urlpatterns += [path("__debug__/", include(debug_toolbar.urls))]
-    except ImportError:
-        pass
+    urlpatterns += [path("__debug__/", include(debug_toolbar.urls))]
@@ -2,16 +2,67 @@
 WebSocket consumers for real-time updates in the Coffee Shop Management System.
 """
 
-import json
+import uuid
 
+import orjson
+from channels.db import database_sync_to_async
 from channels.generic.websocket import AsyncJsonWebsocketConsumer
 
+# config.asgi populates the app registry before importing the routing, so
+# models and services can be imported once here rather than per message
+from apps.kitchen import services as kitchen_services
+from apps.orders.models import Order
+
+# Kitchen display commands and the service each one runs; extra
+# arguments from the message are passed by keyword
+KITCHEN_COMMANDS = {
+    "bump": kitchen_services.bump_order,
+    "recall": kitchen_services.recall_order,
+    "start_preparing": kitchen_services.start_preparing,
+    "set_priority": kitchen_services.set_order_priority,
+}
+
+# Fixed frames sent on every kitchen connection and keep-alive, encoded once
+KITCHEN_WELCOME_FRAME = orjson.dumps({
+    "type": "connection_established",
+    "message": "Connected to kitchen display"
+}).decode()
+KITCHEN_PONG_FRAME = orjson.dumps({"type": "pong"}).decode()
+
+
+@database_sync_to_async
+def _run_kitchen_command(order_id, handler, **kwargs):
+    """
+    Load an order and apply a kitchen display command to it.
+    Returns the service's (success, message); raises Order.DoesNotExist.
+    """
+    # Joins and prefetches exactly what the services and the kitchen
+    # broadcast payload (get_order_data) read
+    order = Order.objects.select_related(
+        "table", "kitchen_ticket__assigned_to"
+    ).prefetch_related("items").get(pk=order_id)
+
+    return handler(order, **kwargs)
+
 
 class BaseConsumer(AsyncJsonWebsocketConsumer):
-    """Base consumer with common functionality."""
+    """
+    Base consumer with common functionality.
+    Producers address every group with the shared "send_event" (one event)
+    or "send_events" (a batch) message types; the event's own "type" is
+    what the client switches on.
+    """
 
     group_name = None
 
+    @classmethod
+    async def decode_json(cls, text_data):
+        return orjson.loads(text_data)
+
+    @classmethod
+    async def encode_json(cls, content):
+        return orjson.dumps(content, default=str).decode()
+
     async def connect(self):
         """Join the room group on connection."""
         if self.group_name:
@@ -24,8 +75,20 @@ class BaseConsumer(AsyncJsonWebsocketConsumer):
             await self.channel_layer.group_discard(self.group_name, self.channel_name)
 
     async def send_event(self, event):
-        """Send event data to WebSocket."""
-        await self.send_json(event["data"])
+        """
+        Send event data to WebSocket. Producers that pre-encode the event
+        (kitchen_services.encode_event) skip the per-socket JSON encoding.
+        """
+        encoded = event.get("encoded")
+        if encoded is not None:
+            await self.send(text_data=encoded)
+        else:
+            await self.send_json(event["data"])
+
+    async def send_events(self, event):
+        """Send a batch of events, one WebSocket message each."""
+        for encoded in event["encoded"]:
+            await self.send(text_data=encoded)
 
 
 class OrderConsumer(BaseConsumer):
@@ -35,15 +98,6 @@ class OrderConsumer(BaseConsumer):
         self.group_name = "cafe_orders"
         await super().connect()
 
-    async def order_created(self, event):
-        await self.send_event(event)
-
-    async def order_updated(self, event):
-        await self.send_event(event)
-
-    async def order_status_changed(self, event):
-        await self.send_event(event)
-
 
 class TableConsumer(BaseConsumer):
     """Consumer for table-related real-time updates."""
@@ -52,15 +106,6 @@ class TableConsumer(BaseConsumer):
         self.group_name = "cafe_tables"
         await super().connect()
 
-    async def table_status_changed(self, event):
-        await self.send_event(event)
-
-    async def session_started(self, event):
-        await self.send_event(event)
-
-    async def session_ended(self, event):
-        await self.send_event(event)
-
 
 class KitchenConsumer(BaseConsumer):
     """Consumer for kitchen display system updates."""
@@ -69,10 +114,7 @@ class KitchenConsumer(BaseConsumer):
         self.group_name = "cafe_kitchen"
         await super().connect()
         # Send initial connection confirmation
-        await self.send_json({
-            "type": "connection_established",
-            "message": "Connected to kitchen display"
-        })
+        await self.send(text_data=KITCHEN_WELCOME_FRAME)
 
     async def receive_json(self, content):
         """
@@ -84,7 +126,7 @@ class KitchenConsumer(BaseConsumer):
 
         if command == "ping":
             # Keep-alive ping
-            await self.send_json({"type": "pong"})
+            await self.send(text_data=KITCHEN_PONG_FRAME)
             return
 
         if command == "request_orders":
@@ -100,111 +142,48 @@ class KitchenConsumer(BaseConsumer):
             })
             return
 
-        # Handle order commands via database sync
-        from asgiref.sync import sync_to_async
-        from apps.orders.models import Order
-        from apps.kitchen import services as kitchen_services
-
-        try:
-            order = await sync_to_async(Order.objects.select_related(
-                "table", "kitchen_ticket"
-            ).prefetch_related("items").get)(pk=order_id)
-        except Order.DoesNotExist:
+        handler = KITCHEN_COMMANDS.get(command)
+        if handler is None:
             await self.send_json({
                 "type": "error",
-                "message": "Order not found"
+                "message": "Unknown command"
             })
             return
 
-        if command == "bump":
-            success, message = await sync_to_async(kitchen_services.bump_order)(order)
-            await self.send_json({
-                "type": "command_result",
-                "command": "bump",
-                "success": success,
-                "message": message
-            })
-
-        elif command == "recall":
-            success, message = await sync_to_async(kitchen_services.recall_order)(order)
-            await self.send_json({
-                "type": "command_result",
-                "command": "recall",
-                "success": success,
-                "message": message
-            })
+        kwargs = {}
+        if command == "set_priority":
+            kwargs["priority"] = content.get("priority", "normal")
 
-        elif command == "start_preparing":
-            success, message = await sync_to_async(kitchen_services.start_preparing)(order)
+        # Fetch and mutate in one thread pool hop
+        try:
+            success, message = await _run_kitchen_command(order_id, handler, **kwargs)
+        except Order.DoesNotExist:
             await self.send_json({
-                "type": "command_result",
-                "command": "start_preparing",
-                "success": success,
-                "message": message
+                "type": "error",
+                "message": "Order not found"
             })
+            return
 
-        elif command == "set_priority":
-            priority = content.get("priority", "normal")
-            success, message = await sync_to_async(kitchen_services.set_order_priority)(
-                order, priority
-            )
-            await self.send_json({
-                "type": "command_result",
-                "command": "set_priority",
-                "success": success,
-                "message": message
-            })
+        await self.send_json({
+            "type": "command_result",
+            "command": command,
+            "success": success,
+            "message": message
+        })
 
     async def send_current_orders(self):
         """Send current kitchen orders to the client."""
-        from asgiref.sync import sync_to_async
-        from apps.kitchen import services as kitchen_services
-
-        orders_data = await sync_to_async(kitchen_services.get_kitchen_orders)()
-
-        # Serialize orders
-        serialized = {
-            "pending": [],
-            "preparing": [],
-            "ready": [],
-        }
-
-        for status, queryset in orders_data.items():
-            orders_list = await sync_to_async(list)(queryset)
-            for order in orders_list:
-                order_data = await sync_to_async(kitchen_services.get_order_data)(order)
-                serialized[status].append(order_data)
+        # Served from a short-lived cache; a miss queries and serializes
+        # every bucket in one thread pool hop
+        serialized = await database_sync_to_async(
+            kitchen_services.get_cached_kitchen_payload
+        )()
 
         await self.send_json({
             "type": "orders_list",
             "orders": serialized
         })
 
-    # Event handlers for broadcasts
-    async def new_order(self, event):
-        """Handle new order broadcast."""
-        await self.send_event(event)
-
-    async def order_updated(self, event):
-        """Handle order updated broadcast."""
-        await self.send_event(event)
-
-    async def order_status_changed(self, event):
-        """Handle order status change broadcast."""
-        await self.send_event(event)
-
-    async def order_bumped(self, event):
-        """Handle order bumped broadcast."""
-        await self.send_event(event)
-
-    async def priority_changed(self, event):
-        """Handle priority change broadcast."""
-        await self.send_event(event)
-
-    async def item_flagged(self, event):
-        """Handle item flagged broadcast."""
-        await self.send_event(event)
-
 
 class WaiterConsumer(BaseConsumer):
     """Consumer for waiter-specific notifications."""
@@ -214,23 +193,17 @@ class WaiterConsumer(BaseConsumer):
         self.group_name = f"waiter_{self.user_id}"
         await super().connect()
 
-    async def order_ready(self, event):
-        await self.send_event(event)
-
-    async def table_assigned(self, event):
-        await self.send_event(event)
-
 
 class CustomerConsumer(BaseConsumer):
     """Consumer for customer order tracking via QR."""
 
     async def connect(self):
-        self.table_uuid = self.scope["url_route"]["kwargs"]["table_uuid"]
+        # Reject anything but a table uuid before touching the channel layer,
+        # so clients can't join arbitrary groups
+        try:
+            self.table_uuid = str(uuid.UUID(self.scope["url_route"]["kwargs"]["table_uuid"]))
+        except ValueError:
+            await self.close(code=4400)
+            return
         self.group_name = f"table_{self.table_uuid}"
         await super().connect()
-
-    async def order_status(self, event):
-        await self.send_event(event)
-
-    async def order_ready(self, event):
-        await self.send_event(event)